@@ -6,13 +6,18 @@ Connected to V4 decision system via message queue (file-based for now)
 """
 import sys
 import os
+import shlex
+import struct
 import subprocess
 import json
+import orjson
+import time
 import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import sqlite3
 
 # Setup
@@ -37,6 +42,194 @@ logging.basicConfig(
 )
 logger = logging.getLogger("AntigravityWorker")
 
+# Timestamp cache: log entries are second-granularity, so reformat at
+# most once per wall-clock second instead of per call
+_ts_cache = [0, ""]
+
+
+def _timestamp() -> str:
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache[0] = sec
+        _ts_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+    return _ts_cache[1]
+
+
+# Persistent action-log handle - reopening the file per entry costs an
+# open/close syscall pair for every status transition
+_log_fp = None
+
+
+def _get_log_fp():
+    global _log_fp
+    if _log_fp is None:
+        _log_fp = open(LOG_FILE, "a", buffering=64 * 1024)
+    return _log_fp
+
+
+# Dedupe window for action ids. Completed files are physically moved out
+# of APPROVED_DIR, so this only guards against retries - bound it rather
+# than letting a long-running daemon grow the set forever.
+_PROCESSED_MAX = 10_000
+
+
+def _mark_processed(processed_ids: "OrderedDict[str, None]", action_id: str):
+    processed_ids[action_id] = None
+    processed_ids.move_to_end(action_id)
+    if len(processed_ids) > _PROCESSED_MAX:
+        processed_ids.popitem(last=False)
+
+
+# Characters that require a real shell (pipes, redirects, expansion...)
+_SHELL_METACHARS = set("|&;<>()$`\\*?[]#~{}\n")
+
+# inotify event masks (Linux) - wake only when a file lands in the queue
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+
+
+def _inotify_init(path: Path) -> Optional[int]:
+    """
+    Set up an inotify watch on path (Linux only).
+
+    Returns the inotify fd, or None if unavailable (macOS etc.) -
+    callers fall back to the 2s poll loop.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK)
+        if fd < 0:
+            return None
+        wd = libc.inotify_add_watch(fd, str(path).encode(), IN_MOVED_TO | IN_CLOSE_WRITE)
+        if wd < 0:
+            os.close(fd)
+            return None
+        return fd
+    except Exception:
+        return None
+
+
+def _inotify_read_names(fd: int) -> List[str]:
+    """
+    Drain pending inotify events and return the affected filenames
+    """
+    names: List[str] = []
+    try:
+        data = os.read(fd, 4096)
+    except (BlockingIOError, OSError):
+        return names
+    offset = 0
+    while offset + 16 <= len(data):
+        _wd, _mask, _cookie, name_len = struct.unpack_from("iIII", data, offset)
+        name = data[offset + 16:offset + 16 + name_len].rstrip(b"\0").decode("utf-8", errors="replace")
+        if name:
+            names.append(name)
+        offset += 16 + name_len
+    return names
+
+
+# Database connections: one writer + a small reader pool, kept warm.
+# WAL lets readers proceed concurrently with the writer.
+ECHO_DB = 'echo.db'
+_DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+)
+_READ_POOL_SIZE = 4
+_write_conn: Optional[sqlite3.Connection] = None
+_read_pool: Optional[asyncio.Queue] = None
+
+
+def _new_db_connection() -> sqlite3.Connection:
+    # cached_statements keeps parsed/planned statements around so repeat
+    # queries skip SQL parsing entirely
+    conn = sqlite3.connect(ECHO_DB, isolation_level=None, check_same_thread=False,
+                           cached_statements=256)
+    for pragma in _DB_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _get_write_conn() -> sqlite3.Connection:
+    global _write_conn
+    if _write_conn is None:
+        _write_conn = _new_db_connection()
+    return _write_conn
+
+
+def _get_read_pool() -> asyncio.Queue:
+    global _read_pool
+    if _read_pool is None:
+        _read_pool = asyncio.Queue()
+        for _ in range(_READ_POOL_SIZE):
+            _read_pool.put_nowait(_new_db_connection())
+    return _read_pool
+
+
+def _is_select(query: str) -> bool:
+    return query.strip().upper().startswith("SELECT")
+
+
+def _run_select(conn: sqlite3.Connection, query: str, params) -> tuple:
+    cursor = conn.execute(query, params)
+    rows = cursor.fetchall()
+    columns = [desc[0] for desc in cursor.description]
+    return rows, columns
+
+
+def _run_write(conn: sqlite3.Connection, query: str, params, own_txn: bool = True) -> int:
+    if not own_txn:
+        # Caller holds a batch transaction; just execute
+        return conn.execute(query, params).rowcount
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        cursor = conn.execute(query, params)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return cursor.rowcount
+
+
+def _sweep_approved() -> List[str]:
+    """
+    List queued action filenames via os.scandir
+
+    Avoids the per-entry Path construction and stat() that Path.glob
+    does (d_type from getdents answers is_file on most filesystems).
+    """
+    try:
+        with os.scandir(APPROVED_DIR) as it:
+            return [e.name for e in it
+                    if e.name.endswith(".json") and e.is_file(follow_symlinks=False)]
+    except FileNotFoundError:
+        return []
+
+
+def _read_action_batch(files: List[Path]) -> List[tuple]:
+    """
+    Read a burst of action files in one go (runs in a worker thread)
+
+    Unreadable files come back with action=None so the caller can route
+    them through the normal failure path.
+    """
+    batch = []
+    for action_file in files:
+        if not action_file.exists():
+            continue
+        try:
+            batch.append((action_file, orjson.loads(action_file.read_bytes())))
+        except Exception:
+            batch.append((action_file, None))
+    return batch
+
 class AntigravityWorker:
     """
     Tactical agent that executes Hunter Epoch approved actions
@@ -51,6 +244,8 @@ class AntigravityWorker:
         """
         self.running = False
         self.worker_id = os.getpid()
+        self._db_ready = False
+        self._coalesced_txn = False
         logger.info(f"Worker {self.worker_id} initialized")
         
         if auto_start:
@@ -65,12 +260,14 @@ class AntigravityWorker:
             details: Action description
             status: Status (START, SUCCESS, FAILURE, BLOCKED)
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        entry = f"[{timestamp}] [ACTION:{action_type}] [{status}] {details}\n"
-        
-        with open(LOG_FILE, "a") as f:
-            f.write(entry)
+        entry = f"[{_timestamp()}] [ACTION:{action_type}] [{status}] {details}\n"
         
+        fp = _get_log_fp()
+        fp.write(entry)
+        if status != "START":
+            # Flush on completion boundaries so results always hit disk
+            fp.flush()
+
         emoji_map = {
             "START": "🚀",
             "SUCCESS": "✅",
@@ -149,13 +346,33 @@ class AntigravityWorker:
         timeout = action.get("timeout", 60)
         
         logger.info(f"Executing shell: {command}")
-        
+
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            # Simple commands skip the /bin/sh fork entirely; anything
+            # using shell features still goes through the shell
+            argv = None
+            if not (set(command) & _SHELL_METACHARS):
+                try:
+                    argv = shlex.split(command)
+                except ValueError:
+                    argv = None
+                # A leading NAME=value token is a shell environment
+                # assignment, not an executable — that still needs sh
+                if argv and "=" in argv[0]:
+                    argv = None
+
+            if argv:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            else:
+                process = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
             
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(),
@@ -201,22 +418,23 @@ class AntigravityWorker:
         logger.info(f"Executing Python code (length: {len(code)})")
         
         try:
+            # Flat argv takes the posix_spawn fast path (a list as arg1
+            # was also simply wrong)
             process = await asyncio.create_subprocess_exec(
-                sys.executable,
-                ["-c", code],
+                sys.executable, "-c", code,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
-            
+
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(),
                 timeout=timeout
             )
-            
+
             success = process.returncode == 0
-            
+
             return {
-                "success": True,
+                "success": success,
                 "output": stdout.decode('utf-8', errors='replace'),
                 "error": stderr.decode('utf-8', errors='replace'),
                 "return_code": process.returncode,
@@ -235,20 +453,7 @@ class AntigravityWorker:
                 "error": str(e),
                 "status": "FAILURE"
             }
-            
-        except asyncio.TimeoutError:
-            return {
-                "success": False,
-                "error": f"Python execution timed out after {timeout}s",
-                "status": "FAILURE"
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "status": "FAILURE"
-            }
-    
+
     async def _execute_task(self, action: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute task-related action via database
@@ -266,8 +471,11 @@ class AntigravityWorker:
         
         try:
             import database
-            database.init_db()
-            
+            if not self._db_ready:
+                # One-time schema setup; no need to re-run per action
+                database.init_db()
+                self._db_ready = True
+
             result = {"success": True, "status": "SUCCESS"}
             
             if operation == "add_task":
@@ -317,18 +525,15 @@ class AntigravityWorker:
         logger.info(f"Executing database query")
         
         try:
-            import sqlite3
-            conn = sqlite3.connect('echo.db')
-            cursor = conn.cursor()
-            
-            cursor.execute(query, params)
-            
-            if query.strip().upper().startswith("SELECT"):
-                rows = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description]
+            if _is_select(query):
+                # Readers run concurrently under WAL; execute off the loop
+                pool = _get_read_pool()
+                conn = await pool.get()
+                try:
+                    rows, columns = await asyncio.to_thread(_run_select, conn, query, params)
+                finally:
+                    pool.put_nowait(conn)
                 results = [dict(zip(columns, row)) for row in rows]
-                
-                conn.close()
                 return {
                     "success": True,
                     "status": "SUCCESS",
@@ -336,15 +541,17 @@ class AntigravityWorker:
                     "row_count": len(results)
                 }
             else:
-                conn.commit()
-                conn.close()
+                row_count = await asyncio.to_thread(
+                    _run_write, _get_write_conn(), query, params,
+                    not self._coalesced_txn
+                )
                 return {
                     "success": True,
                     "status": "SUCCESS",
                     "output": f"Query executed successfully",
-                    "row_count": cursor.rowcount
+                    "row_count": row_count
                 }
-            
+
         except Exception as e:
             return {
                 "success": False,
@@ -356,69 +563,141 @@ class AntigravityWorker:
         """
         Monitor approved action queue and execute actions
         
-        Continuously watches for new files in approved directory
+        Event-driven via inotify on Linux; falls back to 2s polling elsewhere
         """
         self.running = True
         logger.info("Starting action monitor...")
-        
-        processed_ids = set()
-        
+
+        processed_ids: OrderedDict[str, None] = OrderedDict()
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+
+        watch_fd = _inotify_init(APPROVED_DIR)
+        if watch_fd is not None:
+            loop.add_reader(watch_fd, wakeup.set)
+            logger.info("Watching approved queue via inotify")
+
+        # One-shot startup sweep for actions queued before we started
+        pending = _sweep_approved()
+
         while self.running:
             try:
-                # Check for new approved actions
-                if APPROVED_DIR.exists():
-                    for action_file in APPROVED_DIR.glob("*.json"):
-                        try:
-                            action_id = action_file.stem
-                            
-                            if action_id in processed_ids:
-                                continue
-                            
-                            # Read action
-                            with open(action_file, 'r') as f:
-                                action = json.load(f)
-                            
-                            logger.info(f"New approved action: {action_id}")
-                            
-                            # Execute action
-                            result = await self.execute_action(action)
-                            
-                            # Move to completed
-                            completed_file = COMPLETED_DIR / f"{action_id}.json"
-                            action_file.rename(completed_file)
-                            
-                            # Save result
-                            result_file = COMPLETED_DIR / f"{action_id}_result.json"
-                            with open(result_file, 'w') as f:
-                                json.dump(result, f, indent=2)
-                            
-                            processed_ids.add(action_id)
-                            
-                            # If verification requested, move to pending
-                            if action.get("requires_verification", False):
-                                pending_file = PENDING_DIR / f"{action_id}_verify.json"
-                                result_file.rename(pending_file)
-                                logger.warning(f"Action {action_id} requires verification")
-                            
-                        except Exception as e:
-                            logger.error(f"Failed to process action {action_file}: {e}")
-                            # Move to failed
-                            if action_file.exists():
-                                failed_file = COMPLETED_DIR / f"{action_file.stem}_failed.json"
-                                try:
-                                    action_file.rename(failed_file)
-                                except:
-                                    pass
-                
-                # Wait before next check
-                await asyncio.sleep(2)
-                
+                if watch_fd is None:
+                    pending = _sweep_approved()
+
+                # Batch-read the whole burst off the event loop in one hop
+                batch_files = [
+                    APPROVED_DIR / name for name in pending
+                    if (APPROVED_DIR / name).stem not in processed_ids
+                ]
+                if batch_files:
+                    batch = await asyncio.to_thread(_read_action_batch, batch_files)
+                    # Database actions share one transaction; the rest run
+                    # concurrently
+                    db_batch = [(f, a) for f, a in batch
+                                if isinstance(a, dict) and a.get("type") == "database"]
+                    other = [(f, a) for f, a in batch if (f, a) not in db_batch]
+                    coros = [self._process_action_file(f, processed_ids, action=a)
+                             for f, a in other]
+                    if db_batch:
+                        coros.append(self._process_database_batch(db_batch, processed_ids))
+                    await asyncio.gather(*coros)
+                pending = []
+
+                # Wait for the next action (kernel wakeup or poll interval)
+                if watch_fd is not None:
+                    wakeup.clear()
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=30)
+                    except asyncio.TimeoutError:
+                        pass
+                    pending = [n for n in _inotify_read_names(watch_fd) if n.endswith(".json")]
+                else:
+                    await asyncio.sleep(2)
+
             except asyncio.CancelledError:
                 logger.info("Worker monitor cancelled")
                 break
             except Exception as e:
                 logger.error(f"Monitor error: {e}")
                 await asyncio.sleep(5)
+
+        if watch_fd is not None:
+            loop.remove_reader(watch_fd)
+            os.close(watch_fd)
+
+    async def _process_database_batch(self, batch: List[tuple], processed_ids: "OrderedDict[str, None]"):
+        """
+        Run a burst of database actions under a single transaction
+
+        Amortizes the commit fsync across the batch; individual query
+        failures are still reported per-action in their result files.
+        """
+        writes = [a for _, a in batch if a and not _is_select(a.get("query", ""))]
+        coalesce = len(writes) > 1
+        if coalesce:
+            conn = _get_write_conn()
+            await asyncio.to_thread(conn.execute, "BEGIN IMMEDIATE")
+            self._coalesced_txn = True
+        try:
+            for action_file, action in batch:
+                await self._process_action_file(action_file, processed_ids, action=action)
+        finally:
+            if coalesce:
+                self._coalesced_txn = False
+                await asyncio.to_thread(conn.execute, "COMMIT")
+
+    async def _process_action_file(self, action_file: Path, processed_ids: "OrderedDict[str, None]",
+                                   action: Optional[Dict[str, Any]] = None):
+        """
+        Execute and archive a single approved action file
+
+        Args:
+            action: Pre-loaded action dict (from a batch read), or None
+                    to read it from disk here
+        """
+        try:
+            action_id = action_file.stem
+
+            # Read action (unless the batch reader already did)
+            if action is None:
+                action = await asyncio.to_thread(
+                    lambda: orjson.loads(action_file.read_bytes())
+                )
+
+            logger.info(f"New approved action: {action_id}")
+
+            # Execute action
+            result = await self.execute_action(action)
+
+            # Move to completed (file ops stay off the event loop)
+            completed_file = COMPLETED_DIR / f"{action_id}.json"
+            await asyncio.to_thread(action_file.rename, completed_file)
+
+            # Save result
+            result_file = COMPLETED_DIR / f"{action_id}_result.json"
+            await asyncio.to_thread(
+                result_file.write_bytes,
+                orjson.dumps(result, option=orjson.OPT_INDENT_2)
+            )
+
+            _mark_processed(processed_ids, action_id)
+
+            # If verification requested, move to pending
+            if action.get("requires_verification", False):
+                pending_file = PENDING_DIR / f"{action_id}_verify.json"
+                await asyncio.to_thread(result_file.rename, pending_file)
+                logger.warning(f"Action {action_id} requires verification")
+
+        except Exception as e:
+            logger.error(f"Failed to process action {action_file}: {e}")
+            # Move to failed
+            if action_file.exists():
+                failed_file = COMPLETED_DIR / f"{action_file.stem}_failed.json"
+                try:
+                    action_file.rename(failed_file)
+                except:
+                    pass
     
     def stop(self):
         """
@@ -2,22 +2,36 @@
 BetterShift client for Echo V3.
 Provides minimal async wrappers around the BetterShift API.
 """
+import asyncio
 import os
+from datetime import datetime
 from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
 import httpx
 
 BETTERSHIFT_BASE_URL = os.getenv("BETTERSHIFT_BASE_URL", "http://127.0.0.1:3000")
 BETTERSHIFT_API_KEY = os.getenv("BETTERSHIFT_API_KEY", "")
 
+# tzdata parsing is not free; build the local tz once at import
+try:
+    _LOCAL_TZ = ZoneInfo(os.getenv("TZ") or "UTC")
+except Exception:
+    _LOCAL_TZ = ZoneInfo("UTC")
+_LOCAL_TZ_IS_UTC = getattr(_LOCAL_TZ, "key", "") == "UTC"
+
+
+class BetterShiftAuthError(RuntimeError):
+    """Raised when the API answers with a login redirect instead of data."""
+
 # Shared client for connection pooling (saves ~10-20MB)
 _client: Optional[httpx.AsyncClient] = None
 
 
-def _build_headers() -> Dict[str, str]:
-    headers = {"Accept": "application/json"}
-    if BETTERSHIFT_API_KEY:
-        headers["X-API-Key"] = BETTERSHIFT_API_KEY
-    return headers
+# The API key is read from env once at import, so the headers never
+# change - build them once instead of per request
+_HEADERS: Dict[str, str] = {"Accept": "application/json"}
+if BETTERSHIFT_API_KEY:
+    _HEADERS["X-API-Key"] = BETTERSHIFT_API_KEY
 
 
 def _get_client() -> httpx.AsyncClient:
@@ -30,7 +44,7 @@ def _get_client() -> httpx.AsyncClient:
 async def request(method: str, path: str, *, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None) -> Any:
     url = f"{BETTERSHIFT_BASE_URL}{path}"
     client = _get_client()
-    resp = await client.request(method, url, params=params, json=json, headers=_build_headers())
+    resp = await client.request(method, url, params=params, json=json, headers=_HEADERS)
     if resp.status_code >= 400:
         raise RuntimeError(f"BetterShift API error {resp.status_code}: {resp.text}")
     if resp.text:
@@ -47,22 +61,24 @@ async def list_calendars() -> List[Dict[str, Any]]:
 
 
 def _normalize_shift_date(shift: Dict[str, Any]) -> Dict[str, Any]:
+    # The dict comes straight from the JSON decode and is owned by us,
+    # so rewrite the key in place instead of cloning the whole row.
+    # ISO-8601 datetimes have a fixed layout: char 10 is always "T",
+    # which is an O(1) check instead of a substring scan.
     date_value = shift.get("date")
-    if isinstance(date_value, str) and "T" in date_value:
-        shift = {**shift}
-        try:
-            from datetime import datetime
-            from zoneinfo import ZoneInfo
-
-            tz_name = os.getenv("TZ")
-            local_tz = ZoneInfo(tz_name) if tz_name else ZoneInfo("UTC")
-            iso_value = date_value.replace("Z", "+00:00")
-            dt = datetime.fromisoformat(iso_value)
-            if dt.tzinfo is not None:
-                dt = dt.astimezone(local_tz)
-            shift["date"] = dt.date().isoformat()
-        except Exception:
-            shift["date"] = date_value.split("T", 1)[0]
+    if type(date_value) is str and len(date_value) >= 11 and date_value[10] == "T":
+        if _LOCAL_TZ_IS_UTC:
+            # UTC-to-UTC can never move the date; pure slice, no parsing
+            shift["date"] = date_value[:10]
+        else:
+            try:
+                iso_value = date_value.replace("Z", "+00:00")
+                dt = datetime.fromisoformat(iso_value)
+                if dt.tzinfo is not None:
+                    dt = dt.astimezone(_LOCAL_TZ)
+                shift["date"] = dt.date().isoformat()
+            except Exception:
+                shift["date"] = date_value[:10]
     return shift
 
 
@@ -71,11 +87,14 @@ async def list_shifts(calendar_id: str, date: Optional[str] = None) -> List[Dict
     if date:
         params["date"] = date
     data = await request("GET", "/api/shifts", params=params)
-    
-    # Handle auth redirect or error responses
+
+    # A login redirect comes back as the raw HTML page; surface it as a
+    # typed error so callers don't have to sniff dict shapes
+    if isinstance(data, dict) and "raw" in data:
+        raise BetterShiftAuthError("BetterShift requires authentication")
     if not isinstance(data, list):
         return data  # Return as-is for error handling upstream
-    
+
     shifts = data or []
     normalized = [_normalize_shift_date(s) for s in shifts if isinstance(s, dict)]
     if date:
@@ -84,6 +103,51 @@ async def list_shifts(calendar_id: str, date: Optional[str] = None) -> List[Dict
     return normalized
 
 
+async def list_shifts_multi(calendar_ids: List[str], date: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetch shifts for several calendars, preferring one bulk request.
+
+    Tries GET /api/shifts?calendarIds=a,b,c first; if the backend doesn't
+    support it (error, or rows missing calendarId), falls back to
+    per-calendar requests issued concurrently. Returns a dict mapping
+    calendar_id -> shifts (or the per-calendar error/exception object).
+    """
+    params: Dict[str, Any] = {"calendarIds": ",".join(calendar_ids)}
+    if date:
+        params["date"] = date
+
+    try:
+        data = await request("GET", "/api/shifts", params=params)
+    except Exception:
+        data = None
+
+    if isinstance(data, dict) and "raw" in data:
+        # Auth redirect: per-calendar retries would fail the same way
+        raise BetterShiftAuthError("BetterShift requires authentication")
+
+    if isinstance(data, list):
+        grouped: Dict[str, Any] = {cid: [] for cid in calendar_ids}
+        bulk_ok = True
+        for shift in data:
+            if not isinstance(shift, dict) or shift.get("calendarId") not in grouped:
+                bulk_ok = False
+                break
+            grouped[shift["calendarId"]].append(_normalize_shift_date(shift))
+        if bulk_ok:
+            if date:
+                for shifts in grouped.values():
+                    for shift in shifts:
+                        shift["date"] = date
+            return grouped
+
+    # Bulk endpoint unavailable - fall back to concurrent per-calendar calls
+    results = await asyncio.gather(
+        *(list_shifts(cid, date) for cid in calendar_ids),
+        return_exceptions=True,
+    )
+    return dict(zip(calendar_ids, results))
+
+
 async def create_shift(
     calendar_id: str,
     title: str,
@@ -155,9 +219,8 @@ async def delete_note(note_id: str) -> Dict[str, Any]:
 
 def _normalize_note_date(note: Dict[str, Any]) -> Dict[str, Any]:
     date_value = note.get("date")
-    if isinstance(date_value, str) and "T" in date_value:
-        note = {**note}
-        note["date"] = date_value.split("T", 1)[0]
+    if type(date_value) is str and len(date_value) >= 11 and date_value[10] == "T":
+        note["date"] = date_value[:10]
     return note
 
 
@@ -7,6 +7,27 @@ from starlette.responses import JSONResponse
 BETTERSHIFT_BASE_URL = os.getenv("BETTERSHIFT_BASE_URL", "http://127.0.0.1:3000")
 BETTERSHIFT_API_KEY = os.getenv("BETTERSHIFT_API_KEY", "")
 
+# Shared client for connection pooling (same pattern as bettershift_client)
+_proxy_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_proxy_client() -> httpx.AsyncClient:
+    global _proxy_client
+    if _proxy_client is None or _proxy_client.is_closed:
+        _proxy_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _proxy_client
+
+
+async def close_proxy_client():
+    """Release the pooled connections (for ASGI shutdown)."""
+    global _proxy_client
+    if _proxy_client is not None and not _proxy_client.is_closed:
+        await _proxy_client.aclose()
+    _proxy_client = None
+
 
 def _build_headers() -> Dict[str, str]:
     headers: Dict[str, str] = {}
@@ -26,8 +47,8 @@ async def forward_request(request, path: str):
         except Exception:
             body = None
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.request(method, url, params=params, json=body, headers=_build_headers())
+    client = _get_proxy_client()
+    resp = await client.request(method, url, params=params, json=body, headers=_build_headers())
 
     try:
         data = resp.json()
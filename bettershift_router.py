@@ -11,13 +11,19 @@ This allows even 4B models to reliably manage shifts by:
 4. Providing deterministic shortcuts for common patterns
 """
 
+import asyncio
+import functools
+import itertools
 import re
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Tuple
-import pytz
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, Any, Iterator, Tuple
+from zoneinfo import ZoneInfo
 
 import bettershift_client
 
+# Home timezone, resolved once at import
+_TZ = ZoneInfo('Indian/Mauritius')
+
 # =============================================================================
 # HARDCODED DOMAIN KNOWLEDGE
 # =============================================================================
@@ -42,6 +48,18 @@ ENTITY_GROUPS: Dict[str, list] = {
     "all": ["nirvan", "dom", "marley"],
 }
 
+# Actual people (alias entries filtered out), precomputed for the
+# list-all path and the unknown-person error message
+_REAL_PEOPLE = tuple(k for k in ENTITIES if k not in ("me", "my", "i"))
+_KNOWN_PEOPLE_STR = ", ".join(_REAL_PEOPLE)
+
+# Group members pre-resolved to (name, calendar_id) so per-call handling
+# skips the ENTITIES re-lookup
+_GROUP_RESOLVED: Dict[str, list] = {
+    group: [(name, ENTITIES[name]) for name in members]
+    for group, members in ENTITY_GROUPS.items()
+}
+
 # Shift type -> parameters
 SHIFT_TYPES: Dict[str, Dict[str, Any]] = {
     "sa": {
@@ -64,6 +82,18 @@ SHIFT_TYPES: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# The cased/spaced spellings the shortcut patterns and the LLM actually
+# emit, resolved to SHIFT_TYPES keys once at import so the hot add path
+# is a single dict hit instead of lower()+replace() per call
+_SHIFT_ALIASES: Dict[str, str] = {
+    "sa": "sa", "SA": "sa", "Sa": "sa",
+    "sa+": "sa+", "SA+": "sa+", "Sa+": "sa+", "sa +": "sa+", "SA +": "sa+",
+    "off": "off", "Off": "off", "OFF": "off",
+}
+
+# Single reply for the typed auth failure raised by bettershift_client
+_AUTH_REQUIRED_MSG = "❌ BetterShift requires authentication. Please login at http://localhost:3000"
+
 # =============================================================================
 # DETERMINISTIC PATTERN MATCHING (Bypasses LLM entirely)
 # =============================================================================
@@ -72,69 +102,113 @@ SHIFT_TYPES: Dict[str, Dict[str, Any]] = {
 # Format: (regex_pattern, action_type)
 # Groups: (1) person, (2) shift_type or date, (3) date if applicable
 
-SHORTCUT_PATTERNS = [
-    # "Nirvan is on SA Wednesday" / "Nirvan is on SA+ February 15"
-    (r"(\w+)\s+is\s+on\s+(sa\+?)\s+(?:shift\s+)?(?:on\s+)?(.+)", "add"),
-    
+# Each spec is (name, action_type, pattern). Inner capture groups are
+# named <name>_person / <name>_type / <name>_date so the unified regex
+# below can read them back generically.
+_UNIFIED_SPECS = [
+    # "Nirvan is on SA Wednesday" / "Dom is off February 15" - the
+    # shared "<name> is" prefix is factored so the engine rejects
+    # non-candidates after one token
+    ("is", "is",
+     r"(?P<is_person>\w+)\s+is\s+(?:on\s+(?P<is_type>sa\+?)\s+(?:shift\s+)?(?:on\s+)?(?P<is_on_date>.+)"
+     r"|off\s+(?:on\s+)?(?P<is_off_date>.+))"),
+
     # "Put Dom on SA tomorrow" / "Put Nirvan on SA+ Feb 20"
-    (r"put\s+(\w+)\s+on\s+(sa\+?)\s+(?:shift\s+)?(?:on\s+)?(.+)", "add"),
-    
+    ("put_on", "add",
+     r"put\s+(?P<put_on_person>\w+)\s+on\s+(?P<put_on_type>sa\+?)\s+(?:shift\s+)?(?:on\s+)?(?P<put_on_date>.+)"),
+
     # "Add SA shift for Nirvan on Wednesday"
-    (r"add\s+(sa\+?)\s+(?:shift\s+)?for\s+(\w+)\s+(?:on\s+)?(.+)", "add_reversed"),
-    
-    # "Nirvan is off Wednesday" / "Dom is off February 15"
-    (r"(\w+)\s+is\s+off\s+(?:on\s+)?(.+)", "add_off"),
-    
+    ("add_for", "add",
+     r"add\s+(?P<add_for_type>sa\+?)\s+(?:shift\s+)?for\s+(?P<add_for_person>\w+)\s+(?:on\s+)?(?P<add_for_date>.+)"),
+
     # "Remove Nirvan's shift on Wednesday" / "Delete Dom's shift Feb 20"
-    (r"(?:remove|delete|cancel)\s+(\w+)(?:'s)?\s+shift\s+(?:on\s+)?(.+)", "remove"),
-    
+    ("remove", "remove",
+     r"(?:remove|delete|cancel)\s+(?P<remove_person>\w+)(?:'s)?\s+shift\s+(?:on\s+)?(?P<remove_date>.+)"),
+
     # "What are Nirvan's shifts" / "Show Dom's shifts on Feb 15"
-    (r"(?:what\s+are|show|list)\s+(\w+)(?:'s)?\s+shifts?\s+(?:on\s+)?(.+)", "list"),
-    
+    ("show", "list",
+     r"(?:what\s+are|show|list)\s+(?P<show_person>\w+)(?:'s)?\s+shifts?\s+(?:on\s+)?(?P<show_date>.+)"),
+
     # "Who's working today" / "Who is on shift February 15"
-    (r"who(?:'s| is)\s+(?:working|on\s+shift)\s+(?:on\s+)?(.+)", "list_all"),
-    
+    ("who", "list_all",
+     r"who(?:'s| is)\s+(?:working|on\s+shift)\s+(?:on\s+)?(?P<who_date>.+)"),
+
     # "Nirvan's shifts this week"
-    (r"(\w+)(?:'s)?\s+shifts?\s+(?:this\s+)?(.+)", "list"),
+    ("poss", "list",
+     r"(?P<poss_person>\w+)(?:'s)?\s+shifts?\s+(?:this\s+)?(?P<poss_date>.+)"),
 ]
 
+# One compiled alternation: a single pass over the input replaces eight
+# independent re.search scans. Input is lowercased before dispatch and
+# the pattern literals are lowercase, so no IGNORECASE - the engine
+# skips the per-character casefold.
+_UNIFIED_RE = re.compile(
+    "|".join(f"(?P<{name}>{body})" for name, _, body in _UNIFIED_SPECS)
+)
+_UNIFIED_ACTIONS = {name: action for name, action, _ in _UNIFIED_SPECS}
+
+# Hot regex in parse_date, compiled once
+_MONTH_DAY_RE = re.compile(r'(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?')
 
-def try_shortcut(user_input: str) -> Optional[Tuple[str, str, str, str]]:
+# O(1) name lookups for parse_date
+_DAYS = {d: i for i, d in enumerate(
+    ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"))}
+_MONTHS = {
+    "january": 1, "jan": 1, "february": 2, "feb": 2, "march": 3, "mar": 3,
+    "april": 4, "apr": 4, "may": 5, "june": 6, "jun": 6,
+    "july": 7, "jul": 7, "august": 8, "aug": 8, "september": 9, "sep": 9,
+    "october": 10, "oct": 10, "november": 11, "nov": 11, "december": 12, "dec": 12
+}
+
+
+# Every shortcut phrasing starts with one of these verbs or contains one
+# of these literal fragments. A startswith tuple plus a couple of C-level
+# substring scans rejects non-commands before the regex engine runs.
+_SHORTCUT_PREFIXES = ("put ", "add ", "remove ", "delete ", "cancel ",
+                      "what ", "show ", "list ", "who")
+_SHORTCUT_SUBSTRS = (" is on", " is off", " shift")
+
+
+def try_shortcut(text: str) -> Optional[Tuple[str, str, str, str]]:
     """
-    Try to match user input against deterministic patterns.
+    Try to match normalized (lowercased/stripped) input against
+    deterministic patterns.
     Returns (action, person, shift_type, date) or None if no match.
     """
-    text = user_input.lower().strip()
-    
-    for pattern, action_type in SHORTCUT_PATTERNS:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            groups = match.groups()
-            
-            if action_type == "add":
-                # Groups: person, shift_type, date
-                return ("add", groups[0], groups[1], groups[2])
-            
-            elif action_type == "add_reversed":
-                # Groups: shift_type, person, date
-                return ("add", groups[1], groups[0], groups[2])
-            
-            elif action_type == "add_off":
-                # Groups: person, date
-                return ("add", groups[0], "off", groups[1])
-            
-            elif action_type == "remove":
-                # Groups: person, date
-                return ("remove", groups[0], None, groups[1])
-            
-            elif action_type == "list":
-                # Groups: person, date (optional)
-                return ("list", groups[0], None, groups[1] if len(groups) > 1 else "today")
-            
-            elif action_type == "list_all":
-                # Groups: date
-                return ("list", "all", None, groups[0])
-    
+    if not (text.startswith(_SHORTCUT_PREFIXES)
+            or any(s in text for s in _SHORTCUT_SUBSTRS)):
+        return None
+
+    # Commands start at the beginning of the (normalized) input, so an
+    # anchored match avoids re-scanning from every position
+    match = _UNIFIED_RE.match(text)
+    if not match:
+        return None
+
+    # Find which alternative fired via its outer named group
+    for name, action_type in _UNIFIED_ACTIONS.items():
+        if match.group(name) is None:
+            continue
+        g = match.group
+
+        if action_type == "is":
+            shift_type = g("is_type")
+            if shift_type:
+                return ("add", g("is_person"), shift_type, g("is_on_date"))
+            return ("add", g("is_person"), "off", g("is_off_date"))
+
+        elif action_type == "add":
+            return ("add", g(f"{name}_person"), g(f"{name}_type"), g(f"{name}_date"))
+
+        elif action_type == "remove":
+            return ("remove", g(f"{name}_person"), None, g(f"{name}_date"))
+
+        elif action_type == "list":
+            return ("list", g(f"{name}_person"), None, g(f"{name}_date") or "today")
+
+        elif action_type == "list_all":
+            return ("list", "all", None, g(f"{name}_date"))
+
     return None
 
 
@@ -148,73 +222,81 @@ def parse_date(date_str: str) -> str:
     Handles: today, tomorrow, monday-sunday, next week, YYYY-MM-DD
     """
     if not date_str:
-        return datetime.now().strftime("%Y-%m-%d")
-    
+        return datetime.now(_TZ).date().isoformat()
+
     # Strip punctuation and whitespace
     date_str_lower = date_str.lower().strip().rstrip('?!.')
-    tz = pytz.timezone('Indian/Mauritius')
-    now = datetime.now(tz)
-    
-    # Already formatted
-    if re.match(r'\d{4}-\d{2}-\d{2}', date_str_lower):
-        return date_str_lower
-    
+
+    # Users repeat the same phrases ("today", "wednesday") all day long;
+    # results only depend on the calendar date, so memoize per day.
+    # Day rollover invalidates naturally because today_iso changes.
+    result = _parse_date_cached(date_str_lower, datetime.now(_TZ).date().isoformat())
+    return result.isoformat() if result is not None else date_str
+
+
+def parse_date_obj(date_str: str) -> Optional[date]:
+    """Like parse_date but returns a datetime.date (None if unrecognized)."""
+    if not date_str:
+        return datetime.now(_TZ).date()
+    date_str_lower = date_str.lower().strip().rstrip('?!.')
+    return _parse_date_cached(date_str_lower, datetime.now(_TZ).date().isoformat())
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_date_cached(date_str_lower: str, today_iso: str) -> Optional[date]:
+    today = date.fromisoformat(today_iso)
+
+    # Already formatted - parse instead of regex-check + echo, so callers
+    # get a date object without a second parse
+    if date_str_lower[:1].isdigit():
+        try:
+            return date.fromisoformat(date_str_lower[:10])
+        except ValueError:
+            pass
+
     # Relative dates
     if date_str_lower == "today":
-        return now.strftime("%Y-%m-%d")
-    
+        return today
+
     if date_str_lower == "tomorrow":
-        return (now + timedelta(days=1)).strftime("%Y-%m-%d")
-    
+        return today + timedelta(days=1)
+
     if date_str_lower == "yesterday":
-        return (now - timedelta(days=1)).strftime("%Y-%m-%d")
-    
+        return today - timedelta(days=1)
+
     # Day names
-    days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-    if date_str_lower in days:
-        target_day = days.index(date_str_lower)
-        current_day = now.weekday()
-        days_ahead = target_day - current_day
+    target_day = _DAYS.get(date_str_lower)
+    if target_day is not None:
+        days_ahead = target_day - today.weekday()
         if days_ahead <= 0:  # Target day is today or in the past, go to next week
             days_ahead += 7
-        return (now + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
-    
+        return today + timedelta(days=days_ahead)
+
     # "next X" patterns
     if date_str_lower.startswith("next "):
-        day_name = date_str_lower[5:].strip()
-        if day_name in days:
-            target_day = days.index(day_name)
-            current_day = now.weekday()
-            days_ahead = target_day - current_day + 7  # Always next week
-            return (now + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
-    
+        target_day = _DAYS.get(date_str_lower[5:].strip())
+        if target_day is not None:
+            days_ahead = target_day - today.weekday() + 7  # Always next week
+            return today + timedelta(days=days_ahead)
+
     # Month + day patterns: "February 15", "Jan 20", "march 3rd"
-    months = {
-        "january": 1, "jan": 1, "february": 2, "feb": 2, "march": 3, "mar": 3,
-        "april": 4, "apr": 4, "may": 5, "june": 6, "jun": 6,
-        "july": 7, "jul": 7, "august": 8, "aug": 8, "september": 9, "sep": 9,
-        "october": 10, "oct": 10, "november": 11, "nov": 11, "december": 12, "dec": 12
-    }
-    
-    # Try to parse "Month Day" format
-    month_day_match = re.match(r'(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?', date_str_lower)
+    month_day_match = _MONTH_DAY_RE.match(date_str_lower)
     if month_day_match:
         month_name = month_day_match.group(1)
         day = int(month_day_match.group(2))
-        if month_name in months:
-            month = months[month_name]
-            year = now.year
+        month = _MONTHS.get(month_name)
+        if month is not None:
             # If the date has passed this year, assume next year
             try:
-                target_date = datetime(year, month, day, tzinfo=tz)
-                if target_date < now:
-                    target_date = datetime(year + 1, month, day, tzinfo=tz)
-                return target_date.strftime("%Y-%m-%d")
+                target_date = date(today.year, month, day)
+                if target_date < today:
+                    target_date = date(today.year + 1, month, day)
+                return target_date
             except ValueError:
                 pass  # Invalid date (e.g., Feb 30)
-    
-    # Fallback: return as-is (might be a date string)
-    return date_str
+
+    # Fallback: no recognized pattern (caller returns input as-is)
+    return None
 
 
 # =============================================================================
@@ -243,10 +325,12 @@ async def handle_shift(action: str, person: str, shift_type: Optional[str], date
     
     # Handle group references (for add/remove operations on multiple people)
     if person_lower in ENTITY_GROUPS and action != "list":
-        results = []
-        for entity_name in ENTITY_GROUPS[person_lower]:
-            result = await _handle_single(action, entity_name, shift_type, parsed_date)
-            results.append(result)
+        # Operations on different calendars are independent; run them
+        # concurrently so wall time is max() not sum() of latencies
+        results = await asyncio.gather(
+            *(_dispatch(action, name, calendar_id, shift_type, parsed_date)
+              for name, calendar_id in _GROUP_RESOLVED[person_lower])
+        )
         return "\n".join(results)
     
     return await _handle_single(action, person_lower, shift_type, parsed_date)
@@ -258,18 +342,17 @@ async def _handle_single(action: str, person: str, shift_type: Optional[str], da
     # Resolve person -> calendar_id
     calendar_id = ENTITIES.get(person.lower())
     if not calendar_id:
-        known = [k for k in ENTITIES.keys() if k not in ("me", "my", "i")]
-        return f"❓ Don't know who '{person}' is. Known people: {', '.join(known)}"
+        return f"❓ Don't know who '{person}' is. Known people: {_KNOWN_PEOPLE_STR}"
     
-    # Dispatch to action handler
-    if action == "add":
-        return await _add_shift(calendar_id, person, shift_type, date)
-    elif action == "remove":
-        return await _remove_shift(calendar_id, person, shift_type, date)
-    elif action == "list":
-        return await _list_shifts(calendar_id, person, date)
-    else:
+    return await _dispatch(action, person, calendar_id, shift_type, date)
+
+
+async def _dispatch(action: str, person: str, calendar_id: str, shift_type: Optional[str], date: str) -> str:
+    """Route a pre-resolved (person, calendar_id) to its action handler."""
+    handler = _ACTION_DISPATCH.get(action)
+    if handler is None:
         return f"❓ Unknown action '{action}'. Use: add, remove, list"
+    return await handler(calendar_id, person, shift_type, date)
 
 
 async def _add_shift(calendar_id: str, person: str, shift_type: str, date: str) -> str:
@@ -277,7 +360,11 @@ async def _add_shift(calendar_id: str, person: str, shift_type: str, date: str)
     if not shift_type:
         return f"❓ What type of shift? Use: SA, SA+, or Off"
     
-    shift_info = SHIFT_TYPES.get(shift_type.lower().replace(" ", ""))
+    key = _SHIFT_ALIASES.get(shift_type)
+    if key is None:
+        # Unseen spelling - normalize the slow way before giving up
+        key = shift_type.lower().replace(" ", "")
+    shift_info = SHIFT_TYPES.get(key)
     if not shift_info:
         available = ", ".join(SHIFT_TYPES.keys())
         return f"❓ Unknown shift type '{shift_type}'. Available: {available}"
@@ -321,13 +408,15 @@ async def _remove_shift(calendar_id: str, person: str, shift_type: Optional[str]
         await bettershift_client.delete_shift(shift_to_delete["id"])
         
         return f"✅ Removed {shift_to_delete.get('title', 'shift')} for {person.title()} on {date}"
-    
+
+    except bettershift_client.BetterShiftAuthError:
+        return _AUTH_REQUIRED_MSG
     except Exception as e:
         return f"❌ Failed to remove shift: {str(e)}"
 
 
-async def _list_shifts(calendar_id: str, person: str, date: str) -> str:
-    """List shifts for a person or everyone."""
+async def _list_shifts(calendar_id: str, person: str, shift_type: Optional[str], date: str) -> str:
+    """List shifts for a person or everyone (shift_type unused)."""
     
     # Special case: list all people
     if person.lower() in ("all", "everyone"):
@@ -335,18 +424,16 @@ async def _list_shifts(calendar_id: str, person: str, date: str) -> str:
     
     try:
         shifts = await bettershift_client.list_shifts(calendar_id, date)
-        
-        # Handle auth redirect (BetterShift not logged in)
-        if isinstance(shifts, dict) and 'raw' in shifts:
-            return "❌ BetterShift requires authentication. Please login at http://localhost:3000"
-        
-        if not shifts or not isinstance(shifts, list):
+
+        # Non-list bodies are the client's pass-through error channel
+        if shifts and not isinstance(shifts, list):
+            return f"❌ Failed to list shifts: {shifts}"
+
+        if not shifts:
             return f"📅 {person.title()} has no shifts on {date}"
-        
+
         lines = [f"📅 {person.title()}'s shifts on {date}:"]
         for s in shifts:
-            if not isinstance(s, dict):
-                continue
             title = s.get("title", "Shift")
             start = s.get("startTime", "")
             end = s.get("endTime", "")
@@ -354,66 +441,99 @@ async def _list_shifts(calendar_id: str, person: str, date: str) -> str:
                 lines.append(f"  • {title} ({start} - {end})")
             else:
                 lines.append(f"  • {title}")
-        
+
         return "\n".join(lines)
-    
+
+    except bettershift_client.BetterShiftAuthError:
+        return _AUTH_REQUIRED_MSG
     except Exception as e:
         return f"❌ Failed to list shifts: {str(e)}"
 
 
+def _fmt_person_shifts(person: str, shifts: Any) -> Iterator[str]:
+    """Yield the list-all lines for one person's shift results."""
+    # Besides gather exceptions, the client passes non-list error
+    # bodies through as-is ("Return as-is for error handling upstream")
+    if isinstance(shifts, Exception) or not isinstance(shifts, (list, type(None))):
+        yield f"  • {person.title()}: (error)"
+    elif shifts:
+        for s in shifts:
+            title = s.get("title", "Shift")
+            start = s.get("startTime", "")
+            end = s.get("endTime", "")
+            if start and end:
+                yield f"  • {person.title()}: {title} ({start}-{end})"
+            else:
+                yield f"  • {person.title()}: {title}"
+    else:
+        yield f"  • {person.title()}: Off"
+
+
 async def _list_all_shifts(date: str) -> str:
     """List shifts for all known people."""
-    lines = [f"📅 Who's working on {date}:"]
-    
     # Only check actual people (not aliases)
-    people = [k for k in ENTITIES.keys() if k not in ("me", "my", "i")]
-    
-    auth_error = False
-    for person in people:
-        calendar_id = ENTITIES[person]
-        try:
-            shifts = await bettershift_client.list_shifts(calendar_id, date)
-            
-            # Handle auth redirect
-            if isinstance(shifts, dict) and 'raw' in shifts:
-                auth_error = True
-                lines.append(f"  • {person.title()}: (auth required)")
-                continue
-            
-            if shifts and isinstance(shifts, list):
-                for s in shifts:
-                    if not isinstance(s, dict):
-                        continue
-                    title = s.get("title", "Shift")
-                    start = s.get("startTime", "")
-                    end = s.get("endTime", "")
-                    if start and end:
-                        lines.append(f"  • {person.title()}: {title} ({start}-{end})")
-                    else:
-                        lines.append(f"  • {person.title()}: {title}")
-            else:
-                lines.append(f"  • {person.title()}: Off")
-        except Exception as e:
-            lines.append(f"  • {person.title()}: (error)")
-    
-    if auth_error:
-        return "❌ BetterShift requires authentication. Please login at http://localhost:3000"
-    
-    return "\n".join(lines)
+    people = _REAL_PEOPLE
+
+    # One bulk request covers every calendar when the backend supports
+    # it; otherwise the client falls back to concurrent per-calendar calls
+    try:
+        by_calendar = await bettershift_client.list_shifts_multi(
+            [ENTITIES[person] for person in people], date
+        )
+    except bettershift_client.BetterShiftAuthError:
+        return _AUTH_REQUIRED_MSG
+
+    # Per-calendar fallback carries auth failures as exception values
+    if any(isinstance(s, bettershift_client.BetterShiftAuthError)
+           for s in by_calendar.values()):
+        return _AUTH_REQUIRED_MSG
+
+    # Stream lines straight into the join instead of growing a list
+    return "\n".join(itertools.chain(
+        (f"📅 Who's working on {date}:",),
+        *(_fmt_person_shifts(person, by_calendar.get(ENTITIES[person]))
+          for person in people),
+    ))
+
+
+# Jump table for _dispatch - O(1) lookup instead of string-compare chain.
+# All handlers share the (calendar_id, person, shift_type, date) shape.
+_ACTION_DISPATCH = {
+    "add": _add_shift,
+    "remove": _remove_shift,
+    "list": _list_shifts,
+}
 
 
 # =============================================================================
 # INTEGRATION HELPER (Called from llm_client.py)
 # =============================================================================
 
+# Literal tokens that appear in every shortcut phrasing. Most inputs are
+# ordinary chat; a handful of C-level substring scans rejects them before
+# the regex engine ever runs.
+_TRIGGERS = ("is on", "is off", "put ", "add ", "remove ",
+             "delete ", "cancel ", "shift", "who")
+
+# One-pass trailing-punctuation strip; combined with a single lower() +
+# strip() this is the only normalization the whole pipeline needs
+_PUNCT_TRANS = str.maketrans("", "", "?!.")
+
+
 async def try_handle_bettershift(user_input: str) -> Optional[str]:
     """
     Try to handle a BetterShift request deterministically.
     Returns result string if handled, None if LLM should handle it.
-    
+
     This is the main entry point called from llm_client.py
     """
-    shortcut = try_shortcut(user_input)
+    # Normalize once here; try_shortcut and the date field consume the
+    # already-lowercased text
+    text = user_input.translate(_PUNCT_TRANS).lower().strip()
+    if not any(t in text for t in _TRIGGERS):
+        return None
+
+    shortcut = try_shortcut(text)
     if shortcut:
         action, person, shift_type, date = shortcut
         return await handle_shift(action, person, shift_type, date)
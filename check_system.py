@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Echo V3 - Quick system check
+Pings the MLX API and the Echo web UI concurrently, so one hung service
+can't stall the other check.
+"""
+import asyncio
+import httpx
+
+SERVICES = [
+    ("MLX API", "http://127.0.0.1:1234/health"),
+    ("Echo UI", "http://127.0.0.1:5001/"),
+]
+
+
+async def main() -> int:
+    async with httpx.AsyncClient() as client:
+        results = await asyncio.gather(
+            *(client.get(url, timeout=5) for _, url in SERVICES),
+            return_exceptions=True,
+        )
+
+    all_up = True
+    for (name, url), resp in zip(SERVICES, results):
+        if isinstance(resp, Exception):
+            print(f"❌ {name}: {type(resp).__name__} ({url})")
+            all_up = False
+        elif resp.status_code == 200:
+            print(f"✅ {name}: OK")
+        else:
+            print(f"⚠️ {name}: HTTP {resp.status_code}")
+            all_up = False
+
+    return 0 if all_up else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -5,6 +5,11 @@ Manages persistent user context that gets injected into LLM prompts.
 import json
 import os
 
+try:
+    import orjson  # C-backed, several times faster than stdlib json
+except ImportError:
+    orjson = None
+
 CONTEXT_FILE = os.path.join(os.path.dirname(__file__), "user_context.json")
 
 # Default context (used if file doesn't exist)
@@ -19,12 +24,23 @@ DEFAULT_CONTEXT = {
     "memory_support": True
 }
 
+# Parsed-context cache keyed on file mtime: prompt building calls
+# load_context several times per message, and the file rarely changes
+_ctx_cache = {"mtime": None, "data": None}
+_prompt_cache = {"mtime": None, "text": None}
+
 def load_context() -> dict:
     """Load context from file, or return defaults if file missing/corrupted."""
     try:
         if os.path.exists(CONTEXT_FILE):
-            with open(CONTEXT_FILE, 'r') as f:
-                return json.load(f)
+            mtime = os.path.getmtime(CONTEXT_FILE)
+            if _ctx_cache["mtime"] == mtime:
+                return _ctx_cache["data"]
+            with open(CONTEXT_FILE, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            _ctx_cache["mtime"], _ctx_cache["data"] = mtime, data
+            return data
     except Exception as e:
         print(f"[Context] Error loading context: {e}")
     return DEFAULT_CONTEXT.copy()
@@ -32,8 +48,14 @@ def load_context() -> dict:
 def save_context(context: dict) -> bool:
     """Save context to file. Returns True on success."""
     try:
-        with open(CONTEXT_FILE, 'w') as f:
-            json.dump(context, f, indent=4)
+        if orjson:
+            with open(CONTEXT_FILE, 'wb') as f:
+                f.write(orjson.dumps(context, option=orjson.OPT_INDENT_2))
+        else:
+            with open(CONTEXT_FILE, 'w') as f:
+                json.dump(context, f, indent=4)
+        # Keep the cache in sync with what was just written
+        _ctx_cache["mtime"], _ctx_cache["data"] = os.path.getmtime(CONTEXT_FILE), context
         return True
     except Exception as e:
         print(f"[Context] Error saving context: {e}")
@@ -75,7 +97,13 @@ def format_for_prompt() -> str:
     Designed to help the LLM understand the user's situation.
     """
     ctx = load_context()
-    
+
+    # Pure function of the context file; reuse the rendered text until
+    # the file changes
+    mtime = _ctx_cache["mtime"]
+    if mtime is not None and _prompt_cache["mtime"] == mtime:
+        return _prompt_cache["text"]
+
     parts = []
     
     # Name
@@ -106,8 +134,11 @@ def format_for_prompt() -> str:
     # Memory support
     if ctx.get("memory_support"):
         parts.append("User appreciates reminders and memory support. Proactively recall relevant past information.")
-    
-    return "\n".join(parts)
+
+    text = "\n".join(parts)
+    if mtime is not None:
+        _prompt_cache["mtime"], _prompt_cache["text"] = mtime, text
+    return text
 
 def get_location() -> str:
     """Helper to get just the location (for weather queries, etc.)"""
@@ -1,22 +1,73 @@
 import sqlite3
 import json
+import threading
 import numpy as np
 import datetime
 from typing import List, Dict, Optional
 
+try:
+    import faiss  # optional: SIMD batch kernels once the note count grows
+except ImportError:
+    faiss = None
+
+try:
+    import orjson  # C-backed, several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+def _json_loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _json_dumps(obj) -> str:
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
 import os
 
 # Use absolute path to ensure all modules share the same DB
 DB_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tasks.db")
 
+# Per-connection tuning: WAL readers don't block the writer, NORMAL is
+# safe in WAL mode, and the 64MB page cache survives between queries
+# because connections are no longer opened and closed per call
+_CONN_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# One cached connection per thread; open-per-call threw away the page
+# cache and re-opened the WAL/SHM files on every query
+_local = threading.local()
+
 def get_connection():
-    conn = sqlite3.connect(DB_NAME)
-    conn.row_factory = sqlite3.Row
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_NAME)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONN_PRAGMAS:
+            conn.execute(pragma)
+        _local.conn = conn
     return conn
 
+def close_connection():
+    """Close this thread's cached connection (shutdown helper)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
 def init_db():
     conn = get_connection()
     cursor = conn.cursor()
+
+    # WAL mode is sticky per-database file: setting it here once means
+    # every later connection (including ad-hoc sqlite3 CLI sessions)
+    # opens in WAL without re-running the pragma. The remaining pragmas
+    # are per-connection and come from _CONN_PRAGMAS in get_connection.
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS tasks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,21 +107,36 @@ def init_db():
         )
     ''')
 
-    # Notes table with embedding support
+    # Notes table with embedding support (embedding = float32 BLOB)
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS notes (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             content TEXT NOT NULL,
-            embedding TEXT, 
+            embedding BLOB,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
-    
+
     # Check if embedding column exists (migration)
     cursor.execute("PRAGMA table_info(notes)")
     note_columns = [info[1] for info in cursor.fetchall()]
     if "embedding" not in note_columns:
-        cursor.execute("ALTER TABLE notes ADD COLUMN embedding TEXT")
+        cursor.execute("ALTER TABLE notes ADD COLUMN embedding BLOB")
+
+    # One-time migration: legacy rows stored embeddings as JSON text.
+    # Rewrite them as float32 BLOBs (SQLite columns are dynamically
+    # typed, so old TEXT values sit alongside new BLOBs until converted).
+    cursor.execute("SELECT id, embedding FROM notes WHERE typeof(embedding) = 'text'")
+    legacy_rows = cursor.fetchall()
+    for note_id, raw in legacy_rows:
+        try:
+            v = np.asarray(_json_loads(raw), dtype=np.float32)
+            v = v / max(np.linalg.norm(v), 1e-12)  # store unit-norm
+            blob = v.tobytes()
+        except Exception:
+            continue
+        cursor.execute("UPDATE notes SET embedding = ? WHERE id = ?",
+                       (sqlite3.Binary(blob), note_id))
 
     # Facts table for auto-extracted entities and preferences
     cursor.execute('''
@@ -92,8 +158,48 @@ def init_db():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_facts_type ON facts(fact_type)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_facts_created ON facts(created_at)")
 
+    # Hot WHERE columns: status filters on tasks, (status, due_date)
+    # covers get_due_tasks, and (session_id, id) serves get_chat_history
+    # without a scan + sort
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks(status, due_date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_chat_session ON chat_history(session_id, id)")
+
+    # Full-text index over task descriptions so find_tasks_by_description
+    # stops doing LOWER(...) LIKE '%q%' table scans. External-content
+    # table + triggers keep it in sync; rebuilt here to cover rows written
+    # before the index existed. Guarded in case sqlite lacks FTS5.
+    try:
+        cursor.execute('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+                description, content='tasks', content_rowid='id')
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+                INSERT INTO tasks_fts(rowid, description) VALUES (new.id, new.description);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+                INSERT INTO tasks_fts(tasks_fts, rowid, description)
+                VALUES ('delete', old.id, old.description);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF description ON tasks BEGIN
+                INSERT INTO tasks_fts(tasks_fts, rowid, description)
+                VALUES ('delete', old.id, old.description);
+                INSERT INTO tasks_fts(rowid, description) VALUES (new.id, new.description);
+            END
+        ''')
+        cursor.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+        _fts_state["checked"], _fts_state["ok"] = True, True
+    except sqlite3.OperationalError:
+        _fts_state["checked"], _fts_state["ok"] = True, False
+
+    cursor.execute("ANALYZE")
+
     conn.commit()
-    conn.close()
 
 def add_task(description: str, due_date: Optional[str] = None) -> int:
     conn = get_connection()
@@ -101,76 +207,158 @@ def add_task(description: str, due_date: Optional[str] = None) -> int:
     cursor.execute("INSERT INTO tasks (description, due_date) VALUES (?, ?)", (description, due_date))
     conn.commit()
     task_id = cursor.lastrowid
-    conn.close()
     return task_id
 
 def add_note(content: str, embedding: Optional[List[float]] = None) -> int:
     conn = get_connection()
     cursor = conn.cursor()
-    embedding_json = json.dumps(embedding) if embedding else None
-    cursor.execute("INSERT INTO notes (content, embedding) VALUES (?, ?)", (content, embedding_json))
+    # float32 bytes: no JSON text to parse back, ~4x smaller on disk.
+    # Stored unit-norm, so cosine against them is a plain dot product.
+    if embedding:
+        v = np.asarray(embedding, dtype=np.float32)
+        v = v / max(np.linalg.norm(v), 1e-12)
+        embedding_blob = sqlite3.Binary(v.tobytes())
+    else:
+        embedding_blob = None
+    cursor.execute("INSERT INTO notes (content, embedding) VALUES (?, ?)", (content, embedding_blob))
     conn.commit()
     note_id = cursor.lastrowid
-    conn.close()
+    _invalidate_notes_cache()
     return note_id
 
-def get_similar_notes(query_embedding: List[float], top_k: int = 3) -> List[Dict]:
-    """
-    Retrieves notes sorted by cosine similarity to the query embedding.
-    """
+# Cached (matrix, notes) pair for similarity search. Decoding every
+# embedding per query dominated lookup time; instead the unit-normalized
+# float32 matrix is built once and invalidated whenever notes change.
+_notes_cache = {"dirty": True, "matrix": None, "notes": None, "index": None,
+                "db_version": None}
+
+def _invalidate_notes_cache():
+    _notes_cache["dirty"] = True
+
+def _db_version():
+    """Change token for external writes: sqlite bumps data_version when
+    *another* connection commits (same-connection writes are covered by
+    the dirty flags). The counter is per-connection, so the token
+    includes the connection identity — a different thread's connection
+    just forces a rebuild, which errs on the safe side."""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM notes")
-    rows = cursor.fetchall()
-    conn.close()
+    return (id(conn), conn.execute("PRAGMA data_version").fetchone()[0])
 
-    if not rows:
-        return []
+def _get_notes_matrix():
+    """Return (matrix, notes): unit-norm float32 rows + parallel note dicts."""
+    version = _db_version()
+    if not _notes_cache["dirty"] and version == _notes_cache["db_version"]:
+        return _notes_cache["matrix"], _notes_cache["notes"]
 
-    notes_with_scores = []
-    query_vec = np.array(query_embedding)
-    
-    norm_query = np.linalg.norm(query_vec)
-    if norm_query == 0:
-        return [dict(row) for row in rows[:top_k]] # Fallback
+    conn = get_connection()
+    cursor = conn.cursor()
+    # Embedding is pulled here once for the matrix; the cached note
+    # dicts themselves don't carry the blob around
+    cursor.execute("SELECT id, content, embedding, created_at FROM notes")
+    rows = cursor.fetchall()
 
+    notes = []
+    vecs = []
+    dim = None
     for row in rows:
-        note = dict(row)
-        if not note['embedding']:
+        raw = row['embedding']
+        if not raw:
             continue
-            
         try:
-            emb_vec = np.array(json.loads(note['embedding']))
-            norm_emb = np.linalg.norm(emb_vec)
-            if norm_emb == 0:
-                score = 0
+            if isinstance(raw, bytes):
+                # Zero-copy view over the stored float32 bytes
+                vec = np.frombuffer(raw, dtype=np.float32)
             else:
-                score = np.dot(query_vec, emb_vec) / (norm_query * norm_emb)
-            
-            notes_with_scores.append((score, note))
+                vec = np.asarray(_json_loads(raw), dtype=np.float32)  # legacy TEXT row
         except Exception:
             continue
+        if dim is None:
+            dim = vec.shape[0]
+        elif vec.shape[0] != dim:
+            continue  # stale row from a different embedding model
+        notes.append({"id": row["id"], "content": row["content"],
+                      "created_at": row["created_at"]})
+        vecs.append(vec)
+
+    if vecs:
+        matrix = np.vstack(vecs)
+        # Rows are written unit-norm since the BLOB migration; this
+        # renormalization is idempotent for them and only does real work
+        # for any stray legacy vector, so it stays as a cheap guard
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+    else:
+        matrix = None
+
+    # Rows are unit-norm, so inner product == cosine and a FAISS flat
+    # index gives the same answers with SIMD kernels when available
+    index = None
+    if faiss is not None and matrix is not None:
+        index = faiss.IndexFlatIP(matrix.shape[1])
+        index.add(matrix)
+
+    _notes_cache["matrix"] = matrix
+    _notes_cache["notes"] = notes
+    _notes_cache["index"] = index
+    _notes_cache["db_version"] = version
+    _notes_cache["dirty"] = False
+    return matrix, notes
 
-    # Sort by score descending
-    notes_with_scores.sort(key=lambda x: x[0], reverse=True)
-    
-    return [n for score, n in notes_with_scores[:top_k]]
+def get_similar_notes(query_embedding: List[float], top_k: int = 3) -> List[Dict]:
+    """
+    Retrieves notes sorted by cosine similarity to the query embedding.
+    """
+    matrix, notes = _get_notes_matrix()
+    if matrix is None:
+        return []
+
+    query_vec = np.asarray(query_embedding, dtype=np.float32)
+    norm_query = np.linalg.norm(query_vec)
+    if norm_query == 0:
+        return notes[:top_k]  # Fallback
+
+    q = query_vec / norm_query
+    k = min(top_k, len(notes))
+
+    index = _notes_cache["index"]
+    if index is not None:
+        _, ids = index.search(q.reshape(1, -1), k)
+        return [notes[i] for i in ids[0] if i >= 0]
+
+    # Rows are pre-normalized, so one BLAS matvec gives every cosine at
+    # once instead of a Python loop over rows
+    scores = matrix @ q
+    # O(n) partial select of the top k, then sort only those k
+    idx = np.argpartition(-scores, k - 1)[:k]
+    idx = idx[np.argsort(-scores[idx])]
+    return [notes[i] for i in idx]
 
 def get_notes() -> List[Dict]:
+    # Listing doesn't need the embedding blobs; skip shipping them out
+    # of SQLite (they dwarf the content text)
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM notes ORDER BY created_at DESC")
+    cursor.execute("SELECT id, content, created_at FROM notes ORDER BY created_at DESC")
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
+def get_note_embedding(note_id: int) -> Optional[bytes]:
+    """Fetch one note's raw float32 embedding blob (None if unset)."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT embedding FROM notes WHERE id = ?", (note_id,))
+    row = cursor.fetchone()
+    return row["embedding"] if row else None
+
 def delete_note(note_id: int) -> bool:
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("DELETE FROM notes WHERE id = ?", (note_id,))
     conn.commit()
     changes = cursor.rowcount
-    conn.close()
+    if changes:
+        _invalidate_notes_cache()
     return changes > 0
 
 def get_tasks(status: Optional[str] = None) -> List[Dict]:
@@ -181,7 +369,6 @@ def get_tasks(status: Optional[str] = None) -> List[Dict]:
     else:
         cursor.execute("SELECT * FROM tasks ORDER BY id DESC")
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
 def get_due_tasks() -> List[Dict]:
@@ -190,7 +377,6 @@ def get_due_tasks() -> List[Dict]:
     # Find pending tasks where due_date is in the past or now
     cursor.execute("SELECT * FROM tasks WHERE status = 'pending' AND due_date IS NOT NULL AND due_date <= datetime('now', 'localtime')")
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
 def complete_task(task_id: int) -> bool:
@@ -200,7 +386,6 @@ def complete_task(task_id: int) -> bool:
     cursor.execute("UPDATE tasks SET status = 'completed', completed_at = ? WHERE id = ?", (now, task_id))
     conn.commit()
     changes = cursor.rowcount
-    conn.close()
     return changes > 0
 
 def complete_all_tasks() -> int:
@@ -210,13 +395,26 @@ def complete_all_tasks() -> int:
     cursor.execute("UPDATE tasks SET status = 'completed', completed_at = ? WHERE status = 'pending'", (now,))
     conn.commit()
     changes = cursor.rowcount
-    conn.close()
     return changes
 
 def _normalize_task_query(description: str) -> str:
     return " ".join(description.strip().lower().split())
 
 
+# Whether the tasks_fts virtual table exists (FTS5 compiled in and
+# init_db has run); probed once per process
+_fts_state = {"checked": False, "ok": False}
+
+def _fts_available(conn) -> bool:
+    if not _fts_state["checked"]:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"
+        ).fetchone()
+        _fts_state["ok"] = row is not None
+        _fts_state["checked"] = True
+    return _fts_state["ok"]
+
+
 def find_tasks_by_description(description: str, status: Optional[str] = None) -> List[Dict]:
     """Find tasks by case-insensitive partial match, newest first."""
     query = _normalize_task_query(description)
@@ -224,6 +422,27 @@ def find_tasks_by_description(description: str, status: Optional[str] = None) ->
         return []
     conn = get_connection()
     cursor = conn.cursor()
+
+    if _fts_available(conn):
+        # Quoted phrase + prefix star: indexed lookup, and quoting keeps
+        # FTS5 operators (AND/OR/NEAR/-) from being interpreted
+        match = '"' + query.replace('"', '""') + '"*'
+        if status:
+            cursor.execute(
+                "SELECT t.* FROM tasks t JOIN tasks_fts ON t.id = tasks_fts.rowid "
+                "WHERE tasks_fts MATCH ? AND t.status = ? ORDER BY t.id DESC",
+                (match, status),
+            )
+        else:
+            cursor.execute(
+                "SELECT t.* FROM tasks t JOIN tasks_fts ON t.id = tasks_fts.rowid "
+                "WHERE tasks_fts MATCH ? ORDER BY t.id DESC",
+                (match,),
+            )
+        rows = cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    # Fallback when FTS5 isn't compiled into this sqlite build
     like_query = f"%{query}%"
     if status:
         cursor.execute(
@@ -236,7 +455,6 @@ def find_tasks_by_description(description: str, status: Optional[str] = None) ->
             (like_query,),
         )
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
 
@@ -268,7 +486,6 @@ def delete_task(task_id: int) -> bool:
     cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
     conn.commit()
     changes = cursor.rowcount
-    conn.close()
     return changes > 0
 
 def delete_completed_tasks() -> int:
@@ -277,7 +494,6 @@ def delete_completed_tasks() -> int:
     cursor.execute("DELETE FROM tasks WHERE status = 'completed'")
     conn.commit()
     changes = cursor.rowcount
-    conn.close()
     return changes
 
 # --- ARCHIVE HELPERS ---
@@ -290,7 +506,6 @@ def archive_completed_tasks() -> int:
     cursor.execute("UPDATE tasks SET status = 'archived', archived_at = ? WHERE status = 'completed'", (now,))
     conn.commit()
     changes = cursor.rowcount
-    conn.close()
     return changes
 
 def get_archived_tasks() -> List[Dict]:
@@ -298,17 +513,28 @@ def get_archived_tasks() -> List[Dict]:
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM tasks WHERE status = 'archived' ORDER BY completed_at DESC")
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
-def get_all_chat_history() -> List[Dict]:
-    """Get everything for archiving."""
+def iter_all_chat_history():
+    """Stream every chat row oldest-first without loading them all.
+
+    Yields dicts in batches of 1000 driver-side; archival callers stay
+    at bounded memory no matter how old the history gets.
+    """
     conn = get_connection()
     cursor = conn.cursor()
+    cursor.arraysize = 1000
     cursor.execute("SELECT * FROM chat_history ORDER BY id ASC")
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    while True:
+        rows = cursor.fetchmany()
+        if not rows:
+            return
+        for row in rows:
+            yield dict(row)
+
+def get_all_chat_history() -> List[Dict]:
+    """Get everything for archiving (prefer iter_all_chat_history)."""
+    return list(iter_all_chat_history())
 
 def clear_chat_history(session_id=None):
     conn = get_connection()
@@ -318,21 +544,30 @@ def clear_chat_history(session_id=None):
     else:
         cursor.execute("DELETE FROM chat_history")
     conn.commit()
-    conn.close()
 
 def save_chat_message(session_id: str, role: str, content: str):
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("INSERT INTO chat_history (session_id, role, content) VALUES (?, ?, ?)", (session_id, role, content))
     conn.commit()
-    conn.close()
+
+def save_chat_messages_bulk(rows: List[tuple]):
+    """Insert many (session_id, role, content) rows in one transaction.
+
+    One commit (one fsync) for the whole batch instead of one per row.
+    """
+    conn = get_connection()
+    conn.executemany(
+        "INSERT INTO chat_history (session_id, role, content) VALUES (?, ?, ?)",
+        rows,
+    )
+    conn.commit()
 
 def get_chat_history(session_id: str, limit: int = 50) -> List[Dict]:
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT role, content FROM chat_history WHERE session_id = ? ORDER BY id ASC LIMIT ?", (session_id, limit))
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
 def mark_message_processed(message_id: str):
@@ -340,14 +575,21 @@ def mark_message_processed(message_id: str):
     cursor = conn.cursor()
     cursor.execute("INSERT OR IGNORE INTO processed_messages (message_id) VALUES (?)", (message_id,))
     conn.commit()
-    conn.close()
+
+def mark_messages_processed_bulk(message_ids: List[str]):
+    """Mark a batch of message ids processed in one transaction."""
+    conn = get_connection()
+    conn.executemany(
+        "INSERT OR IGNORE INTO processed_messages (message_id) VALUES (?)",
+        ((message_id,) for message_id in message_ids),
+    )
+    conn.commit()
 
 def is_message_processed(message_id: str) -> bool:
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT 1 FROM processed_messages WHERE message_id = ?", (message_id,))
     exists = cursor.fetchone() is not None
-    conn.close()
     return exists
 
 def add_fact(fact_type: str, value: str, confidence: float = 1.0,
@@ -355,60 +597,135 @@ def add_fact(fact_type: str, value: str, confidence: float = 1.0,
     """Store a fact with optional embedding"""
     conn = get_connection()
     cursor = conn.cursor()
-    embedding_json = json.dumps(embedding) if embedding else None
-    metadata_json = json.dumps(metadata) if metadata else None
+    embedding_json = _json_dumps(embedding) if embedding else None
+    metadata_json = _json_dumps(metadata) if metadata else None
     cursor.execute(
         "INSERT INTO facts (fact_type, value, confidence, source, metadata, embedding) VALUES (?, ?, ?, ?, ?, ?)",
         (fact_type, value, confidence, source, metadata_json, embedding_json)
     )
     conn.commit()
     fact_id = cursor.lastrowid
-    conn.close()
+    _invalidate_facts_cache()
     return fact_id
 
-def get_similar_facts(query_embedding: list, fact_type: str = None, top_k: int = 5) -> List[Dict]:
-    """Search facts by semantic similarity"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    if fact_type:
-        cursor.execute("SELECT * FROM facts WHERE fact_type = ?", (fact_type,))
-    else:
-        cursor.execute("SELECT * FROM facts")
-    
-    rows = cursor.fetchall()
-    conn.close()
+def add_facts_bulk(rows: List[tuple]) -> List[int]:
+    """Insert many (fact_type, value, confidence, source, metadata, embedding)
+    facts in one transaction; metadata/embedding are plain objects or None.
 
+    One commit (one fsync) for the whole batch instead of one per fact.
+    Returns the new fact ids.
+    """
     if not rows:
         return []
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.executemany(
+        "INSERT INTO facts (fact_type, value, confidence, source, metadata, embedding) VALUES (?, ?, ?, ?, ?, ?)",
+        [(ft, value, confidence, source,
+          _json_dumps(metadata) if metadata else None,
+          _json_dumps(embedding) if embedding else None)
+         for ft, value, confidence, source, metadata, embedding in rows],
+    )
+    conn.commit()
+    _invalidate_facts_cache()
+    # Within a single transaction the rowids are assigned contiguously,
+    # so the batch occupies the range ending at the connection's last
+    # insert rowid (cursor.lastrowid is unset after executemany)
+    last = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+    return list(range(last - len(rows) + 1, last + 1))
+
+# Fact-embedding cache, same shape as the notes cache: one contiguous
+# unit-norm float32 matrix with parallel id/type arrays, rebuilt lazily
+# after a write. Mutable metadata (access_count etc.) is re-read from
+# sqlite per query, so only add/delete invalidates.
+_facts_cache = {"dirty": True, "matrix": None, "ids": None, "types": None,
+                "db_version": None}
+
+def _invalidate_facts_cache():
+    _facts_cache["dirty"] = True
+
+def _get_facts_matrix():
+    """Return (matrix, ids, types): unit-norm float32 rows + parallel arrays."""
+    version = _db_version()
+    if not _facts_cache["dirty"] and version == _facts_cache["db_version"]:
+        return _facts_cache["matrix"], _facts_cache["ids"], _facts_cache["types"]
 
-    facts_with_scores = []
-    query_vec = np.array(query_embedding)
-    norm_query = np.linalg.norm(query_vec)
-    
-    if norm_query == 0:
-        return [dict(row) for row in rows[:top_k]]
+    conn = get_connection()
+    cursor = conn.cursor()
+    # Only what the scan needs; full rows are fetched for results only
+    cursor.execute("SELECT id, fact_type, embedding FROM facts WHERE embedding IS NOT NULL")
+    rows = cursor.fetchall()
 
+    ids = []
+    types = []
+    vecs = []
+    dim = None
     for row in rows:
-        fact = dict(row)
-        if not fact.get('embedding'):
-            continue
-            
         try:
-            emb_vec = np.array(json.loads(fact['embedding']))
-            norm_emb = np.linalg.norm(emb_vec)
-            if norm_emb == 0:
-                score = 0
-            else:
-                score = np.dot(query_vec, emb_vec) / (norm_query * norm_emb)
-            
-            facts_with_scores.append((score, fact))
+            vec = np.asarray(_json_loads(row['embedding']), dtype=np.float32)
         except Exception:
             continue
+        if dim is None:
+            dim = vec.shape[0]
+        elif vec.shape[0] != dim:
+            continue  # stale row from a different embedding model
+        ids.append(row['id'])
+        types.append(row['fact_type'])
+        vecs.append(vec)
+
+    if vecs:
+        matrix = np.vstack(vecs)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        ids = np.asarray(ids, dtype=np.int64)
+        types = np.asarray(types)
+    else:
+        matrix = None
+        ids = None
+        types = None
 
-    facts_with_scores.sort(key=lambda x: x[0], reverse=True)
-    
-    return [f for score, f in facts_with_scores[:top_k]]
+    _facts_cache["matrix"] = matrix
+    _facts_cache["ids"] = ids
+    _facts_cache["types"] = types
+    _facts_cache["db_version"] = version
+    _facts_cache["dirty"] = False
+    return matrix, ids, types
+
+def get_similar_facts(query_embedding: list, fact_type: str = None, top_k: int = 5) -> List[Dict]:
+    """Search facts by semantic similarity"""
+    matrix, ids, types = _get_facts_matrix()
+    if matrix is None:
+        return []
+
+    query_vec = np.asarray(query_embedding, dtype=np.float32)
+    norm_query = np.linalg.norm(query_vec)
+    if norm_query == 0:
+        return get_facts(fact_type=fact_type, limit=top_k)  # Fallback
+
+    # Rows are pre-normalized, so one BLAS matvec gives every cosine at
+    # once; the type filter is a vectorized mask instead of a WHERE that
+    # would force a separate matrix per type
+    scores = matrix @ (query_vec / norm_query)
+    if fact_type:
+        scores = np.where(types == fact_type, scores, -np.inf)
+
+    k = min(top_k, scores.shape[0])
+    # O(n) partial select of the top k, then sort only those k
+    idx = np.argpartition(-scores, k - 1)[:k]
+    idx = idx[np.argsort(-scores[idx])]
+    idx = idx[scores[idx] > -np.inf]
+    if idx.size == 0:
+        return []
+
+    # Re-read the winning rows so access_count/last_accessed are current
+    conn = get_connection()
+    cursor = conn.cursor()
+    top_ids = [int(ids[i]) for i in idx]
+    placeholders = ",".join("?" * len(top_ids))
+    cursor.execute(f"SELECT * FROM facts WHERE id IN ({placeholders})", top_ids)
+    by_id = {row['id']: dict(row) for row in cursor.fetchall()}
+    return [by_id[fid] for fid in top_ids if fid in by_id]
 
 def get_facts(fact_type: str = None, limit: int = 50) -> List[Dict]:
     """Retrieve facts, optionally filtered by type"""
@@ -421,7 +738,6 @@ def get_facts(fact_type: str = None, limit: int = 50) -> List[Dict]:
         cursor.execute("SELECT * FROM facts ORDER BY created_at DESC LIMIT ?", (limit,))
     
     rows = cursor.fetchall()
-    conn.close()
     return [dict(row) for row in rows]
 
 def update_fact_access(fact_id: int):
@@ -434,7 +750,6 @@ def update_fact_access(fact_id: int):
         (now, fact_id)
     )
     conn.commit()
-    conn.close()
 
 def delete_fact(fact_id: int) -> bool:
     """Delete a specific fact"""
@@ -443,7 +758,8 @@ def delete_fact(fact_id: int) -> bool:
     cursor.execute("DELETE FROM facts WHERE id = ?", (fact_id,))
     conn.commit()
     changes = cursor.rowcount
-    conn.close()
+    if changes:
+        _invalidate_facts_cache()
     return changes > 0
 
 if __name__ == "__main__":
@@ -31,7 +31,7 @@ try:
         print("   ✅ Test note cleaned up.")
     else:
         print("   ❌ Note NOT found in DB after insert.")
-    conn.close()
+    database.close_connection()
 
 except Exception as e:
     print(f"❌ Database error: {e}")
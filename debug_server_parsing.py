@@ -3,64 +3,81 @@ import json
 import re
 import time
 
+try:
+    import orjson  # C-backed, several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+def _loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+# raw_decode reports where a value ends, so one C-level parse replaces
+# the old Python byte walk that counted braces (and miscounted ones
+# inside string literals)
+_JSON_DECODER = json.JSONDecoder()
+
+# Compiled once: parse_tools runs per response (per chunk when
+# streaming), so skip the per-call pattern-cache lookup
+_TOOL_CALL_RE = re.compile(r"<tool_call>(.*?)</tool_call>", re.DOTALL)
+
+# Positional-arg heuristic: models sometimes emit {"arg1": ...}; map it
+# to the real parameter name per tool with one dict hit
+_ARG1_KEYS = {"search": "query", "navigate": "url", "click": "selector", "snapshot": "view"}
+
 def extract_all_json(text):
-    """Greedily find all JSON-like blocks by balancing braces."""
+    """Find all top-level JSON objects in free-form model output.
+
+    Single pass: every byte is visited at most once, by C code (str.find
+    or the decoder's scanner), and string-quoted braces are handled by
+    the parser rather than by hand.
+    """
     results = []
-    start_indices = [i for i, char in enumerate(text) if char == '{']
-    
-    consumed_until = -1
-    for start in start_indices:
-        if start < consumed_until:
+    i = text.find('{')
+    while i != -1:
+        try:
+            _, end = _JSON_DECODER.raw_decode(text, i)
+        except ValueError:
+            i = text.find('{', i + 1)
             continue
-            
-        stack = 0
-        for i in range(start, len(text)):
-            if text[i] == '{':
-                stack += 1
-            elif text[i] == '}':
-                stack -= 1
-                if stack == 0:
-                    potential = text[start:i+1]
-                    try:
-                        json.loads(potential)
-                        results.append(potential)
-                        consumed_until = i + 1
-                        break
-                    except:
-                        pass
+        results.append(text[i:end])
+        i = text.find('{', end)
     return results
 
 def parse_tools(response_text, tools_list):
     message = {"role": "assistant", "content": response_text.strip()}
     tool_calls = []
     text = response_text.strip()
+    # One clock read per parse; the per-call index keeps ids unique
+    now = int(time.time())
     
     # 1. Look for <tool_call> XML tags (Qwen format)
-    xml_matches = re.findall(r"<tool_call>(.*?)</tool_call>", text, re.DOTALL)
+    xml_matches = _TOOL_CALL_RE.findall(text)
     print(f"DEBUG: xml_matches found: {len(xml_matches)}")
     for block in xml_matches:
         try:
             # Maybe there's a JSON inside the XML block?
             json_blocks = extract_all_json(block)
             data_str = json_blocks[0] if json_blocks else block.strip()
-            tool_data = json.loads(data_str)
+            tool_data = _loads(data_str)
             if "name" in tool_data:
                 name = tool_data["name"]
                 args = tool_data.get("parameters") or tool_data.get("arguments") or {}
                 
                 # Heuristic Mapping
                 if isinstance(args, dict) and "arg1" in args and len(args) == 1:
-                    if name == "search": args = {"query": args["arg1"]}
-                    elif name == "navigate": args = {"url": args["arg1"]}
-                    elif name == "click": args = {"selector": args["arg1"]}
-                    elif name == "snapshot": args = {"view": args["arg1"]}
+                    key = _ARG1_KEYS.get(name)
+                    if key:
+                        args = {key: args["arg1"]}
                 
                 tool_calls.append({
-                    "id": f"call_{int(time.time())}_{len(tool_calls)}",
+                    "id": f"call_{now}_{len(tool_calls)}",
                     "type": "function",
                     "function": {
                         "name": name,
-                        "arguments": json.dumps(args) if not isinstance(args, str) else args
+                        "arguments": _dumps(args) if not isinstance(args, str) else args
                     }
                 })
         except Exception as e:
@@ -73,23 +90,23 @@ def parse_tools(response_text, tools_list):
         print(f"DEBUG: potential_json found: {len(json_blocks)}")
         for block in json_blocks:
             try:
-                tool_data = json.loads(block)
+                tool_data = _loads(block)
                 if "name" in tool_data and ("parameters" in tool_data or "arguments" in tool_data):
                     name = tool_data["name"]
                     args = tool_data.get("parameters") or tool_data.get("arguments")
                     
                     # Heuristic Mapping
                     if isinstance(args, dict) and "arg1" in args and len(args) == 1:
-                        if name == "search": args = {"query": args["arg1"]}
-                        elif name == "navigate": args = {"url": args["arg1"]}
-                        elif name == "click": args = {"selector": args["arg1"]}
+                        key = _ARG1_KEYS.get(name)
+                        if key:
+                            args = {key: args["arg1"]}
                     
                     tool_calls.append({
-                        "id": f"call_{int(time.time())}_{len(tool_calls)}",
+                        "id": f"call_{now}_{len(tool_calls)}",
                         "type": "function",
                         "function": {
                             "name": name,
-                            "arguments": json.dumps(args) if not isinstance(args, str) else args
+                            "arguments": _dumps(args) if not isinstance(args, str) else args
                         }
                     })
             except Exception as e:
@@ -1,6 +1,10 @@
-from huggingface_hub import hf_hub_download
 import os
-import shutil
+
+# Opt into the Rust parallel downloader before huggingface_hub imports;
+# it chunks large files across connections (needs `pip install hf_transfer`)
+os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+from huggingface_hub import hf_hub_download
 
 repo_id = "sapientinc/HRM-checkpoint-ARC-2"
 filename = "checkpoint"
@@ -8,10 +12,17 @@ local_dir = os.path.expanduser("~/echo/brain")
 target_name = "sapient_hrm_arc2.bin"
 
 print(f"Downloading {filename} from {repo_id}...")
-downloaded_path = hf_hub_download(repo_id=repo_id, filename=filename, local_dir=local_dir)
+# local_dir_use_symlinks=False writes the real file into local_dir, so
+# the rename below is a same-filesystem move instead of a cache copy
+downloaded_path = hf_hub_download(
+    repo_id=repo_id,
+    filename=filename,
+    local_dir=local_dir,
+    local_dir_use_symlinks=False,
+)
 
 target_path = os.path.join(local_dir, target_name)
 print(f"Renaming {downloaded_path} to {target_path}...")
-shutil.move(downloaded_path, target_path)
+os.replace(downloaded_path, target_path)  # atomic, no data copy
 
 print("Download complete.")
@@ -6,13 +6,26 @@ Integrates with MLX LLM for local processing
 """
 
 import os
+import re
 import json
 import asyncio
-import httpx
+import hashlib
+import aiohttp
 import logging
+from collections import OrderedDict
+from itertools import islice
+from string import Template
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
+try:
+    import orjson  # C-backed, several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+# Both raise ValueError subclasses on bad input
+_loads = orjson.loads if orjson else json.loads
+
 import database
 import mlx_embeddings
 
@@ -20,6 +33,22 @@ load_dotenv()
 
 MLX_URL = "http://127.0.0.1:1234/v1"
 
+# Shared session: keep-alive to the local MLX server instead of a fresh
+# TCP handshake per extraction. aiohttp handles many concurrent requests
+# to one host with less pool contention than httpx.
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=32,
+                                           keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=60, connect=10),
+        )
+    return _session
+
 # Fact types to extract
 FACT_TYPES = {
     "entity": "Names, IDs, identifiers for people, systems, calendars, projects",
@@ -35,11 +64,47 @@ SKIP_KEYWORDS = [
     "testing", "placeholder", "fake", "mock", "dummy"
 ]
 
+# One compiled alternation scans each message a single time instead of
+# one full-text pass per keyword; \b avoids the old substring false
+# positives ("latest" used to count as "test")
+_SKIP_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, SKIP_KEYWORDS)) + r")\b",
+    re.IGNORECASE,
+)
+
+# Signal prefilter: the MLX call costs seconds, these regexes cost
+# microseconds. A capitalized token that doesn't start a sentence looks
+# like a name, a run of 3+ digits looks like an ID, and the word list
+# covers preference/context phrasing from the extraction categories.
+_ENTITY_HINT_RE = re.compile(r"(?<![.!?\n])\s[A-Z][a-zA-Z]+|\d{3,}")
+_SIGNAL_WORDS_RE = re.compile(
+    r"\b(?:prefer|prefers|use|uses|using|i'm|my|project|calendar|always|never)\b",
+    re.IGNORECASE,
+)
+
+
+def _has_extraction_signal(messages: List[Dict]) -> bool:
+    """Cheap test for whether a conversation could contain facts.
+
+    False positives are fine (the LLM still filters); the point is that
+    a short "ok thanks" exchange never pays an LLM round-trip.
+    """
+    total_chars = 0
+    for m in messages:
+        content = m.get('content', '')
+        total_chars += len(content)
+        if total_chars >= 200:
+            return True
+        if _ENTITY_HINT_RE.search(content) or _SIGNAL_WORDS_RE.search(content):
+            return True
+    return False
+
+
 # Extraction prompt template
 EXTRACTION_PROMPT = """You are a fact extraction specialist. Analyze this conversation and extract important facts.
 
 CONVERSATION:
-{conversation}
+$conversation
 
 Extract facts in these categories:
 - entity: Names, IDs, identifiers (e.g., "Nirvan's calendar ID: cal-abc123", "Project Alpha")
@@ -50,11 +115,11 @@ Extract facts in these categories:
 
 Return ONLY valid JSON in this exact format:
 [
-    {{
+    {
         "type": "entity|preference|tech_stack|pattern|context",
         "value": "exact fact text from conversation",
         "confidence": 0.0-1.0
-    }}
+    }
 ]
 
 Rules:
@@ -64,6 +129,18 @@ Rules:
 - Return [] if no important facts found
 """
 
+# Substituting into a precompiled Template is one regex pass; formatting
+# the raw string re-scans the whole ~1KB template per call
+_EXTRACTION_TPL = Template(EXTRACTION_PROMPT)
+
+_SYSTEM_MSG = {"role": "system", "content": "You are a JSON-only fact extractor. Return valid JSON arrays only."}
+
+# Extraction results keyed by SHA-256 of the conversation text:
+# archival replays and retry loops re-submit identical conversations,
+# and a dict hit replaces a multi-second MLX call. LRU-bounded.
+_EXTRACT_CACHE: OrderedDict[str, List[Dict]] = OrderedDict()
+_EXTRACT_CACHE_MAX = 512
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("FactExtractor")
 
@@ -75,13 +152,12 @@ def should_skip_extraction(messages: List[Dict]) -> tuple[bool, str]:
     Returns:
         (should_skip, reason)
     """
-    # Combine all message content
-    full_text = " ".join([m.get('content', '').lower() for m in messages])
-    
-    # Check for skip keywords
-    for keyword in SKIP_KEYWORDS:
-        if keyword in full_text:
-            return True, f"Contains '{keyword}' keyword"
+    # Scan message-by-message; no joined/lowered copy of the whole
+    # conversation, and the first hit short-circuits
+    for m in messages:
+        match = _SKIP_RE.search(m.get('content', ''))
+        if match:
+            return True, f"Contains '{match.group().lower()}' keyword"
     
     # Check if auto-extraction is disabled
     if os.getenv("AUTO_EXTRACT_FACTS", "true").lower() == "false":
@@ -103,77 +179,93 @@ async def extract_facts_from_messages(messages: List[Dict]) -> List[Dict]:
     if not messages:
         return []
     
-    # Format conversation for LLM
-    conversation_text = "\n".join([
+    # Format conversation for LLM: last 50 messages to avoid context
+    # overflow. islice streams the tail straight into join without
+    # materializing a slice copy of a potentially huge history list.
+    conversation_text = "\n".join(
         f"{m['role'].upper()}: {m['content']}"
-        for m in messages[-50:]  # Last 50 messages to avoid context overflow
-    ])
+        for m in islice(messages, max(len(messages) - 50, 0), None)
+    )
     
+    # Identical conversation → identical facts; skip the LLM entirely
+    cache_key = hashlib.sha256(conversation_text.encode()).hexdigest()
+    cached = _EXTRACT_CACHE.get(cache_key)
+    if cached is not None:
+        _EXTRACT_CACHE.move_to_end(cache_key)
+        logger.info(f"Extraction cache hit ({len(cached)} facts)")
+        return list(cached)
+
     # Build prompt
-    prompt = EXTRACTION_PROMPT.format(conversation=conversation_text)
+    prompt = _EXTRACTION_TPL.substitute(conversation=conversation_text)
     
     messages_for_llm = [
-        {"role": "system", "content": "You are a JSON-only fact extractor. Return valid JSON arrays only."},
+        _SYSTEM_MSG,
         {"role": "user", "content": prompt}
     ]
     
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{MLX_URL}/chat/completions",
-                json={
-                    "messages": messages_for_llm,
-                    "max_tokens": 800,
-                    "temperature": 0.1
-                }
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"MLX API error: {response.status_code}")
+        session = _get_session()
+        async with session.post(
+            f"{MLX_URL}/chat/completions",
+            json={
+                "messages": messages_for_llm,
+                "max_tokens": 800,
+                "temperature": 0.1
+            }
+        ) as response:
+            if response.status != 200:
+                logger.error(f"MLX API error: {response.status}")
                 return []
-            
-            result = response.json()
-            content = result["choices"][0]["message"]["content"].strip()
-            
-            # Extract JSON from response
-            content = content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            content = content.strip()
-            
-            # Parse JSON
-            facts = json.loads(content)
-            
-            # Validate and filter
-            valid_facts = []
-            for fact in facts:
-                if not isinstance(fact, dict):
-                    continue
-                if fact.get("type") not in FACT_TYPES:
-                    continue
-                if not fact.get("value"):
-                    continue
-                
-                # Ensure confidence is valid
-                confidence = fact.get("confidence", 0.7)
-                if not isinstance(confidence, (int, float)):
-                    confidence = 0.7
-                confidence = max(0.0, min(1.0, confidence))
-                
-                valid_facts.append({
-                    "type": fact["type"],
-                    "value": fact["value"],
-                    "confidence": confidence
-                })
-            
-            logger.info(f"Extracted {len(valid_facts)} facts")
-            return valid_facts
-            
-    except json.JSONDecodeError as e:
+
+            # content_type=None: MLX doesn't always set the JSON header
+            result = await response.json(content_type=None, loads=_loads)
+        content = result["choices"][0]["message"]["content"].strip()
+
+        # Extract JSON from response
+        if content.startswith("```json"):
+            content = content[7:]
+        if content.startswith("```"):
+            content = content[3:]
+        if content.endswith("```"):
+            content = content[:-3]
+        content = content.strip()
+
+        # Parse JSON
+        facts = _loads(content)
+
+        # Validate and filter; the prompt caps extraction at 10 facts,
+        # so stop validating once we have that many
+        valid_facts = []
+        for fact in facts:
+            if len(valid_facts) >= 10:
+                break
+            if not isinstance(fact, dict):
+                continue
+            if fact.get("type") not in FACT_TYPES:
+                continue
+            if not fact.get("value"):
+                continue
+
+            # Ensure confidence is valid
+            confidence = fact.get("confidence", 0.7)
+            if not isinstance(confidence, (int, float)):
+                confidence = 0.7
+            confidence = max(0.0, min(1.0, confidence))
+
+            valid_facts.append({
+                "type": fact["type"],
+                "value": fact["value"],
+                "confidence": confidence
+            })
+
+        _EXTRACT_CACHE[cache_key] = valid_facts
+        if len(_EXTRACT_CACHE) > _EXTRACT_CACHE_MAX:
+            _EXTRACT_CACHE.popitem(last=False)
+
+        logger.info(f"Extracted {len(valid_facts)} facts")
+        return valid_facts
+
+    except ValueError as e:  # json/orjson JSONDecodeError
         logger.error(f"JSON parse error: {e}")
         logger.debug(f"Content: {content[:200]}...")
         return []
@@ -194,29 +286,28 @@ async def store_facts(extracted_facts: List[Dict], source: str = "chat_history")
         List of fact IDs created
     """
     fact_ids = []
-    
-    for fact in extracted_facts:
-        try:
-            # Generate embedding for semantic search
-            embedding = mlx_embeddings.get_embedding(fact["value"])
-            
-            # Store in database
-            fact_id = database.add_fact(
-                fact_type=fact["type"],
-                value=fact["value"],
-                confidence=fact["confidence"],
-                source=source,
-                metadata={"extracted_at": "auto"},
-                embedding=embedding
-            )
-            
-            fact_ids.append(fact_id)
-            logger.debug(f"Stored fact {fact_id}: {fact['type']} - {fact['value'][:50]}...")
-            
-        except Exception as e:
-            logger.error(f"Failed to store fact: {e}")
-            continue
-    
+    if not extracted_facts:
+        return fact_ids
+
+    # One model forward pass for the whole batch instead of one per
+    # fact; identical strings are embedded once and shared
+    unique_texts = list(dict.fromkeys(f["value"] for f in extracted_facts))
+    embedded = await asyncio.to_thread(mlx_embeddings.get_batch_embeddings, unique_texts)
+    embedding_by_text = dict(zip(unique_texts, embedded))
+
+    # One executemany inside one transaction beats fanning the inserts
+    # out: sqlite pays the statement parse and the fsync once per batch
+    rows = [
+        (fact["type"], fact["value"], fact["confidence"], source,
+         {"extracted_at": "auto"}, embedding_by_text.get(fact["value"]) or None)
+        for fact in extracted_facts
+    ]
+    try:
+        fact_ids = await asyncio.to_thread(database.add_facts_bulk, rows)
+    except Exception as e:
+        logger.error(f"Failed to store facts: {e}")
+        return fact_ids
+
     logger.info(f"Stored {len(fact_ids)} facts in database")
     return fact_ids
 
@@ -253,7 +344,14 @@ async def extract_and_archive_facts(messages: List[Dict], archive_source: str =
         result["reason"] = reason
         logger.info(f"Skipping extraction: {reason}")
         return result
-    
+
+    # Skip the LLM entirely when there's nothing worth extracting
+    if not _has_extraction_signal(messages):
+        result["skipped"] = True
+        result["reason"] = "No extraction signal (short, low-information conversation)"
+        logger.info("Skipping extraction: no signal in conversation")
+        return result
+
     # Extract facts
     logger.info(f"Extracting facts from {len(messages)} messages...")
     extracted_facts = await extract_facts_from_messages(messages)
@@ -283,31 +381,37 @@ async def recall_facts(query: str, fact_type: str = None, limit: int = 5) -> str
     Returns:
         Formatted string of facts
     """
-    # Generate embedding for query
-    query_embedding = mlx_embeddings.get_embedding(query)
-    
+    # Embedding and similarity search are synchronous; run them off the
+    # event loop so concurrent extractions aren't stalled behind them
+    query_embedding = await asyncio.to_thread(mlx_embeddings.get_embedding, query)
+
     if not query_embedding:
         return "❌ Could not generate embedding for query."
-    
+
     # Search facts
-    facts = database.get_similar_facts(
+    facts = await asyncio.to_thread(
+        database.get_similar_facts,
         query_embedding,
         fact_type=fact_type,
-        top_k=limit
+        top_k=limit,
     )
-    
+
     if not facts:
         return "No relevant facts found."
-    
+
     # Format results
     result = f"Found {len(facts)} fact(s):\n"
     for i, fact in enumerate(facts, 1):
         result += f"{i}. [{fact['fact_type'].upper()}] {fact['value']}\n"
         result += f"   Confidence: {fact['confidence']:.2f} | Accessed: {fact.get('access_count', 0)} times\n"
-        
-        # Update access tracking
-        database.update_fact_access(fact['id'])
-    
+
+    # Access tracking is bookkeeping; batch the writes off-loop after
+    # the result string is built
+    await asyncio.gather(
+        *(asyncio.to_thread(database.update_fact_access, fact['id']) for fact in facts),
+        return_exceptions=True,
+    )
+
     return result.strip()
 
 
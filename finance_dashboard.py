@@ -3,6 +3,272 @@ Finance Dashboard View for Echo V3
 Renders account balances, transactions, and spending analytics with cyberpunk aesthetics
 """
 
+import html
+from functools import lru_cache
+from string import Template
+
+# Map account color to neon variant
+_NEON_MAP = {
+    "purple": "--neon-purple",
+    "blue": "--neon-blue",
+    "pink": "--neon-pink",
+    "yellow": "--neon-yellow"
+}
+
+# The CSS never changes between requests; keeping it as a plain module
+# constant means the interpreter stops re-lexing a ~200-line f-string
+# (and un-escaping every doubled brace) on each render
+_FINANCE_CSS = '''<style>
+        .finance-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+            gap: 1.5rem;
+            margin-bottom: 2rem;
+        }
+        
+        .finance-account-card {
+            background: var(--glass);
+            border: 1px solid var(--glass-border);
+            border-radius: 16px;
+            padding: 1.5rem;
+            position: relative;
+            overflow: hidden;
+            backdrop-filter: blur(20px);
+            transition: all 0.3s cubic-bezier(0.2, 0.8, 0.2, 1);
+        }
+        
+        .finance-account-card:hover {
+            transform: translateY(-4px);
+            box-shadow: 0 20px 40px rgba(0,0,0,0.3);
+        }
+        
+        .account-name {
+            font-family: 'Orbitron', sans-serif;
+            font-size: 0.9rem;
+            color: var(--text-dim);
+            text-transform: uppercase;
+            letter-spacing: 2px;
+            margin-bottom: 0.5rem;
+        }
+        
+        .account-balance {
+            font-size: 2.2rem;
+            font-weight: 700;
+            color: #fff;
+            margin-bottom: 0.5rem;
+        }
+        
+        .currency {
+            font-size: 1.2rem;
+            color: var(--text-dim);
+            font-weight: 400;
+        }
+        
+        .account-glow {
+            position: absolute;
+            bottom: 0;
+            right: 0;
+            width: 100px;
+            height: 100px;
+            border-radius: 50%;
+            filter: blur(40px);
+            pointer-events: none;
+        }
+        
+        .finance-section {
+            background: var(--glass);
+            border: 1px solid var(--glass-border);
+            border-radius: 16px;
+            padding: 2rem;
+            margin-bottom: 2rem;
+            backdrop-filter: blur(20px);
+        }
+        
+        .section-title {
+            font-family: 'Orbitron', sans-serif;
+            font-size: 1.4rem;
+            color: var(--neon-blue);
+            margin-bottom: 1.5rem;
+            letter-spacing: 2px;
+            text-transform: uppercase;
+            display: flex;
+            align-items: center;
+            gap: 1rem;
+        }
+        
+        .section-title::before {
+            content: '';
+            width: 4px;
+            height: 24px;
+            background: var(--neon-blue);
+            box-shadow: 0 0 10px var(--neon-blue);
+        }
+        
+        .transaction-row {
+            display: grid;
+            grid-template-columns: 100px 1fr 150px;
+            gap: 1rem;
+            padding: 1rem;
+            border-bottom: 1px solid var(--glass-border);
+            transition: background 0.2s ease;
+            align-items: center;
+        }
+        
+        .transaction-row:hover {
+            background: rgba(255,255,255,0.03);
+        }
+        
+        .tx-date {
+            font-family: 'Rajdhani', monospace;
+            color: var(--text-dim);
+            font-size: 0.9rem;
+        }
+        
+        .tx-desc {
+            display: flex;
+            flex-direction: column;
+            gap: 0.3rem;
+        }
+        
+        .tx-description {
+            color: var(--text-main);
+            font-weight: 500;
+        }
+        
+        .tx-category {
+            color: var(--text-dim);
+            font-size: 0.85rem;
+            font-style: italic;
+        }
+        
+        .tx-amount {
+            text-align: right;
+            font-weight: 700;
+            font-size: 1.1rem;
+        }
+        
+        .transaction-row.income .tx-amount {
+            color: #00ff88;
+            text-shadow: 0 0 10px rgba(0,255,136,0.3);
+        }
+        
+        .transaction-row.expense .tx-amount {
+            color: var(--neon-pink);
+            text-shadow: 0 0 10px rgba(255,0,85,0.3);
+        }
+        
+        .summary-grid {
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            gap: 1.5rem;
+            margin-top: 2rem;
+        }
+        
+        .summary-stat {
+            text-align: center;
+            padding: 1.5rem;
+            background: rgba(0,0,0,0.3);
+            border-radius: 12px;
+            border: 1px solid var(--glass-border);
+        }
+        
+        .stat-label {
+            font-size: 0.85rem;
+            color: var(--text-dim);
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            margin-bottom: 0.5rem;
+        }
+        
+        .stat-value {
+            font-size: 2rem;
+            font-weight: 700;
+            color: #fff;
+        }
+        
+        .stat-value.income {
+            color: #00ff88;
+        }
+        
+        .stat-value.expense {
+            color: var(--neon-pink);
+        }
+        
+        .stat-value.net {
+            color: var(--neon-blue);
+        }
+        
+        @media (max-width: 768px) {
+            .transaction-row {
+                grid-template-columns: 1fr;
+                gap: 0.5rem;
+            }
+            
+            .tx-amount {
+                text-align: left;
+            }
+            
+            .summary-grid {
+                grid-template-columns: 1fr;
+            }
+        }
+    </style>'''
+
+# Outer page shell: Template.substitute is one regex pass over the
+# string, with only the per-request values left as placeholders
+_FINANCE_SHELL = Template('''$css
+
+    
+    <div class="chat-header">
+        <div>
+            <div class="chat-title">💰 Finance Dashboard</div>
+            <div class="chat-subtitle">Transaction Management & Analytics</div>
+        </div>
+    </div>
+    
+    <div class="page-container">
+        <!-- Account Balances -->
+        <div class="finance-grid">
+            $account_cards
+        </div>
+        
+        <!-- Recent Transactions -->
+        <div class="finance-section">
+            <div class="section-title">📝 Recent Transactions</div>
+            $transaction_rows
+        </div>
+        
+        <!-- Summary Stats -->
+        <div class="summary-grid">
+            <div class="summary-stat">
+                <div class="stat-label">Income</div>
+                <div class="stat-value income">+$total_income</div>
+            </div>
+            <div class="summary-stat">
+                <div class="stat-label">Expenses</div>
+                <div class="stat-value expense">-$total_expenses</div>
+            </div>
+            <div class="summary-stat">
+                <div class="stat-label">Net</div>
+                <div class="stat-value net">$net</div>
+            </div>
+        </div>
+    </div>
+''')
+
+
+@lru_cache(maxsize=256)
+def _render_account_card(name: str, balance, currency: str, neon_color: str) -> str:
+    """Render one account card. Arguments arrive already HTML-escaped."""
+    return f'''
+                <div class="finance-account-card" style="border-color: var({neon_color});">
+                    <div class="account-name">{name}</div>
+                    <div class="account-balance">{balance:,.2f} <span class="currency">{currency}</span></div>
+                    <div class="account-glow" style="background: var({neon_color}); opacity: 0.1;"></div>
+                </div>
+            '''
+
+
 async def render_finance_view():
     """Render finance dashboard with WYGIWYH data"""
     try:
@@ -27,33 +293,28 @@ async def render_finance_view():
                 balance_by_currency[currency] = 0
             balance_by_currency[currency] += balance
         
-        # Render account cards
-        account_cards = ""
+        # Render account cards: collect parts and join once instead of
+        # growing a string with += (which reallocates each time).
+        # Accounts barely change between refreshes, so the per-card
+        # render is cached; fields are escaped before they key the cache
+        account_parts = []
         for account in accounts:
             name = account.get("name", "Unknown")
             balance = account.get("balance", 0)
             currency = account.get("currency", {}).get("code", "USD")
             color = account.get("color", "purple")
-            
-            # Map color to neon variant
-            neon_map = {
-                "purple": "--neon-purple",
-                "blue": "--neon-blue",
-                "pink": "--neon-pink",
-                "yellow": "--neon-yellow"
-            }
-            neon_color = neon_map.get(color.lower(), "--neon-purple")
-            
-            account_cards += f'''
-                <div class="finance-account-card" style="border-color: var({neon_color});">
-                    <div class="account-name">{name}</div>
-                    <div class="account-balance">{balance:,.2f} <span class="currency">{currency}</span></div>
-                    <div class="account-glow" style="background: var({neon_color}); opacity: 0.1;"></div>
-                </div>
-            '''
-        
-        # Render transactions
-        transaction_rows = ""
+            neon_color = _NEON_MAP.get(str(color).lower(), "--neon-purple")
+
+            account_parts.append(_render_account_card(
+                html.escape(str(name)), balance,
+                html.escape(str(currency)), neon_color))
+        account_cards = "".join(account_parts)
+
+        # One pass over the visible transactions: parse each amount
+        # once, render the row, and accumulate the summary totals
+        transaction_parts = []
+        total_income = 0.0
+        total_expenses = 0.0
         for tx in transactions_raw[:10]:
             date = tx.get("date", "")
             amount = tx.get("amount", 0)
@@ -63,15 +324,21 @@ async def render_finance_view():
                     amount = float(amount)
                 except ValueError:
                     amount = 0.0
-            currency = tx.get("currency", {}).get("code", "USD")
-            description = tx.get("description", "No description")
-            category = tx.get("category", {}).get("name", "Uncategorized")
-            
+            # Same escaping as the account cards: transaction text comes
+            # straight from WYGIWYH and goes into the page
+            currency = html.escape(str(tx.get("currency", {}).get("code", "USD")))
+            description = html.escape(str(tx.get("description", "No description")))
+            category = html.escape(str(tx.get("category", {}).get("name", "Uncategorized")))
+
             # Color code by type
-            amount_class = "income" if amount >= 0 else "expense"
-            sign = "+" if amount >= 0 else "-"
-            
-            transaction_rows += f'''
+            if amount >= 0:
+                amount_class, sign = "income", "+"
+                total_income += amount
+            else:
+                amount_class, sign = "expense", "-"
+                total_expenses -= amount
+
+            transaction_parts.append(f'''
                 <div class="transaction-row {amount_class}">
                     <div class="tx-date">{date}</div>
                     <div class="tx-desc">
@@ -80,255 +347,18 @@ async def render_finance_view():
                     </div>
                     <div class="tx-amount">{sign}{abs(amount):,.2f} {currency}</div>
                 </div>
-            '''
-        
-        # Calculate spending summary
-        def safe_amount(tx):
-            amount = tx.get("amount", 0)
-            if isinstance(amount, str):
-                try:
-                    return float(amount)
-                except ValueError:
-                    return 0.0
-            return amount
-        
-        total_income = sum(safe_amount(tx) for tx in transactions_raw if safe_amount(tx) >= 0)
-        total_expenses = sum(abs(safe_amount(tx)) for tx in transactions_raw if safe_amount(tx) < 0)
+            ''')
+        transaction_rows = "".join(transaction_parts)
         net = total_income - total_expenses
         
-        return f'''
-            <style>
-                .finance-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-                    gap: 1.5rem;
-                    margin-bottom: 2rem;
-                }}
-                
-                .finance-account-card {{
-                    background: var(--glass);
-                    border: 1px solid var(--glass-border);
-                    border-radius: 16px;
-                    padding: 1.5rem;
-                    position: relative;
-                    overflow: hidden;
-                    backdrop-filter: blur(20px);
-                    transition: all 0.3s cubic-bezier(0.2, 0.8, 0.2, 1);
-                }}
-                
-                .finance-account-card:hover {{
-                    transform: translateY(-4px);
-                    box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-                }}
-                
-                .account-name {{
-                    font-family: 'Orbitron', sans-serif;
-                    font-size: 0.9rem;
-                    color: var(--text-dim);
-                    text-transform: uppercase;
-                    letter-spacing: 2px;
-                    margin-bottom: 0.5rem;
-                }}
-                
-                .account-balance {{
-                    font-size: 2.2rem;
-                    font-weight: 700;
-                    color: #fff;
-                    margin-bottom: 0.5rem;
-                }}
-                
-                .currency {{
-                    font-size: 1.2rem;
-                    color: var(--text-dim);
-                    font-weight: 400;
-                }}
-                
-                .account-glow {{
-                    position: absolute;
-                    bottom: 0;
-                    right: 0;
-                    width: 100px;
-                    height: 100px;
-                    border-radius: 50%;
-                    filter: blur(40px);
-                    pointer-events: none;
-                }}
-                
-                .finance-section {{
-                    background: var(--glass);
-                    border: 1px solid var(--glass-border);
-                    border-radius: 16px;
-                    padding: 2rem;
-                    margin-bottom: 2rem;
-                    backdrop-filter: blur(20px);
-                }}
-                
-                .section-title {{
-                    font-family: 'Orbitron', sans-serif;
-                    font-size: 1.4rem;
-                    color: var(--neon-blue);
-                    margin-bottom: 1.5rem;
-                    letter-spacing: 2px;
-                    text-transform: uppercase;
-                    display: flex;
-                    align-items: center;
-                    gap: 1rem;
-                }}
-                
-                .section-title::before {{
-                    content: '';
-                    width: 4px;
-                    height: 24px;
-                    background: var(--neon-blue);
-                    box-shadow: 0 0 10px var(--neon-blue);
-                }}
-                
-                .transaction-row {{
-                    display: grid;
-                    grid-template-columns: 100px 1fr 150px;
-                    gap: 1rem;
-                    padding: 1rem;
-                    border-bottom: 1px solid var(--glass-border);
-                    transition: background 0.2s ease;
-                    align-items: center;
-                }}
-                
-                .transaction-row:hover {{
-                    background: rgba(255,255,255,0.03);
-                }}
-                
-                .tx-date {{
-                    font-family: 'Rajdhani', monospace;
-                    color: var(--text-dim);
-                    font-size: 0.9rem;
-                }}
-                
-                .tx-desc {{
-                    display: flex;
-                    flex-direction: column;
-                    gap: 0.3rem;
-                }}
-                
-                .tx-description {{
-                    color: var(--text-main);
-                    font-weight: 500;
-                }}
-                
-                .tx-category {{
-                    color: var(--text-dim);
-                    font-size: 0.85rem;
-                    font-style: italic;
-                }}
-                
-                .tx-amount {{
-                    text-align: right;
-                    font-weight: 700;
-                    font-size: 1.1rem;
-                }}
-                
-                .transaction-row.income .tx-amount {{
-                    color: #00ff88;
-                    text-shadow: 0 0 10px rgba(0,255,136,0.3);
-                }}
-                
-                .transaction-row.expense .tx-amount {{
-                    color: var(--neon-pink);
-                    text-shadow: 0 0 10px rgba(255,0,85,0.3);
-                }}
-                
-                .summary-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(3, 1fr);
-                    gap: 1.5rem;
-                    margin-top: 2rem;
-                }}
-                
-                .summary-stat {{
-                    text-align: center;
-                    padding: 1.5rem;
-                    background: rgba(0,0,0,0.3);
-                    border-radius: 12px;
-                    border: 1px solid var(--glass-border);
-                }}
-                
-                .stat-label {{
-                    font-size: 0.85rem;
-                    color: var(--text-dim);
-                    text-transform: uppercase;
-                    letter-spacing: 1px;
-                    margin-bottom: 0.5rem;
-                }}
-                
-                .stat-value {{
-                    font-size: 2rem;
-                    font-weight: 700;
-                    color: #fff;
-                }}
-                
-                .stat-value.income {{
-                    color: #00ff88;
-                }}
-                
-                .stat-value.expense {{
-                    color: var(--neon-pink);
-                }}
-                
-                .stat-value.net {{
-                    color: var(--neon-blue);
-                }}
-                
-                @media (max-width: 768px) {{
-                    .transaction-row {{
-                        grid-template-columns: 1fr;
-                        gap: 0.5rem;
-                    }}
-                    
-                    .tx-amount {{
-                        text-align: left;
-                    }}
-                    
-                    .summary-grid {{
-                        grid-template-columns: 1fr;
-                    }}
-                }}
-            </style>
-            
-            <div class="chat-header">
-                <div>
-                    <div class="chat-title">💰 Finance Dashboard</div>
-                    <div class="chat-subtitle">Transaction Management & Analytics</div>
-                </div>
-            </div>
-            
-            <div class="page-container">
-                <!-- Account Balances -->
-                <div class="finance-grid">
-                    {account_cards if account_cards else '<div style="color: var(--text-dim); padding: 2rem; text-align: center;">No accounts found. Configure WYGIWYH first.</div>'}
-                </div>
-                
-                <!-- Recent Transactions -->
-                <div class="finance-section">
-                    <div class="section-title">📝 Recent Transactions</div>
-                    {transaction_rows if transaction_rows else '<div style="color: var(--text-dim); padding: 1rem; text-align: center;">No transactions found.</div>'}
-                </div>
-                
-                <!-- Summary Stats -->
-                <div class="summary-grid">
-                    <div class="summary-stat">
-                        <div class="stat-label">Income</div>
-                        <div class="stat-value income">+{total_income:,.2f}</div>
-                    </div>
-                    <div class="summary-stat">
-                        <div class="stat-label">Expenses</div>
-                        <div class="stat-value expense">-{total_expenses:,.2f}</div>
-                    </div>
-                    <div class="summary-stat">
-                        <div class="stat-label">Net</div>
-                        <div class="stat-value net">{"+" if net >= 0 else "-"}{abs(net):,.2f}</div>
-                    </div>
-                </div>
-            </div>
-        '''
+        return _FINANCE_SHELL.substitute(
+            css=_FINANCE_CSS,
+            account_cards=account_cards if account_cards else '<div style="color: var(--text-dim); padding: 2rem; text-align: center;">No accounts found. Configure WYGIWYH first.</div>',
+            transaction_rows=transaction_rows if transaction_rows else '<div style="color: var(--text-dim); padding: 1rem; text-align: center;">No transactions found.</div>',
+            total_income=f"{total_income:,.2f}",
+            total_expenses=f"{total_expenses:,.2f}",
+            net=f"{'+' if net >= 0 else '-'}{abs(net):,.2f}",
+        )
         
     except Exception as e:
         return f'''
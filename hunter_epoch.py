@@ -17,6 +17,9 @@ CURRENT_LIQUIDITY = 0.0
 MAX_AUTO_SPEND = 5000.0  # Rs
 MAX_AUTO_TIME_COMMITMENT = 2.0  # Hours
 
+# The approval result never varies; build it once instead of per audit
+_APPROVED = {"approved": True, "reason": "Aligned with Hunter Epoch."}
+
 class HunterEpoch:
     @staticmethod
     def audit_action(action_type: str, details: dict) -> dict:
@@ -46,4 +49,4 @@ class HunterEpoch:
         # If action is about "buying nonsense", flag it.
         # This function is usually called AFTER Sapient has theoretically "understood" the intent.
         
-        return {"approved": True, "reason": "Aligned with Hunter Epoch."}
+        return _APPROVED
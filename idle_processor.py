@@ -11,22 +11,41 @@ import subprocess
 import logging
 import signal
 
+try:
+    import psutil  # optional: reads the process table directly, no shell
+except ImportError:
+    psutil = None
+
 logger = logging.getLogger("ResourceGuard")
 
 CRITICAL_PROCESSES = ["Serato DJ Pro", "Resolume Arena", "Ableton Live"]
+_CRITICAL_LOWER = tuple(p.lower() for p in CRITICAL_PROCESSES)
 AI_WORKER_NAMES = ["v4_orchestrator.py", "partner_brain.py", "listener_daemon.py"] 
 # Note: listener_daemon requires low cpu, maybe we don't pause hearing, just thinking.
 
 class ResourceGuard:
     def __init__(self):
         self.paused = False
+        # Worker PIDs discovered once and reused; a pause/resume is then
+        # one kill syscall per worker instead of a pkill fork+scan
+        self._worker_pids = {}
 
     def check_critical_processes(self):
         try:
-            # grep -v grep prevents matching the grepping process itself
-            cmd = f"ps aux | grep -v grep | grep -E '{'|'.join(CRITICAL_PROCESSES)}'"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            return len(result.stdout.strip()) > 0
+            if psutil is not None:
+                # Name check per process, first hit wins — no fork at all
+                for proc in psutil.process_iter(['name']):
+                    name = proc.info['name']
+                    if name and name.lower().startswith(_CRITICAL_LOWER):
+                        return True
+                return False
+            # Fallback: one ps fork without a shell, matched in Python
+            # (the old sh -c "ps aux | grep" spawned three processes and
+            # interpolated the patterns into a shell command line)
+            result = subprocess.run(["ps", "-axo", "comm"],
+                                    capture_output=True, text=True)
+            listing = result.stdout.lower()
+            return any(p in listing for p in _CRITICAL_LOWER)
         except Exception as e:
             logger.error(f"Process check failed: {e}")
             return False
@@ -52,13 +71,43 @@ class ResourceGuard:
         for proc_name in AI_WORKER_NAMES:
             self._signal_process(proc_name, signal.SIGCONT)
 
-    def _signal_process(self, proc_name, sig):
+    def _find_worker_pids(self, proc_name):
+        """Full-cmdline match, same semantics as the old pkill -f."""
+        pids = []
         try:
-            # pkill -SIGNAME -f Pattern
-            # Use strict matching to avoid killing benign things with similar names
-            subprocess.run(["pkill", f"-{int(sig)}", "-f", proc_name], check=False)
+            if psutil is not None:
+                for proc in psutil.process_iter(['pid', 'cmdline']):
+                    cmdline = proc.info['cmdline'] or []
+                    if any(proc_name in part for part in cmdline):
+                        pids.append(proc.info['pid'])
+            else:
+                result = subprocess.run(["pgrep", "-f", proc_name],
+                                        capture_output=True, text=True)
+                pids = [int(p) for p in result.stdout.split()]
         except Exception as e:
-            logger.error(f"Failed to signal {proc_name}: {e}")
+            logger.error(f"PID lookup failed for {proc_name}: {e}")
+        return pids
+
+    def _signal_process(self, proc_name, sig):
+        if sig == signal.SIGSTOP:
+            # Always rescan before pausing: a worker that restarted
+            # since the last scan would otherwise keep burning CPU for
+            # the whole mixing session. Pauses are rare transitions, so
+            # the scan cost doesn't matter here.
+            pids = self._find_worker_pids(proc_name)
+        else:
+            # Resume exactly what the pause stopped
+            pids = self._worker_pids.get(proc_name) or self._find_worker_pids(proc_name)
+        alive = []
+        for pid in pids:
+            try:
+                os.kill(pid, sig)
+                alive.append(pid)
+            except ProcessLookupError:
+                pass  # worker restarted; rediscovered on the next miss
+            except Exception as e:
+                logger.error(f"Failed to signal {proc_name}[{pid}]: {e}")
+        self._worker_pids[proc_name] = alive
 
 if __name__ == "__main__":
     guard = ResourceGuard()
@@ -66,4 +115,6 @@ if __name__ == "__main__":
     logger.info("Resource Guard Active. Monitoring...")
     while True:
         guard.manage_resources()
-        time.sleep(5)
+        # The check is now cheap enough to poll every second, so a
+        # mixing app gets the AI paused within ~1s instead of ~5s
+        time.sleep(1)
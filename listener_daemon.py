@@ -17,10 +17,23 @@ import numpy as np
 import logging
 import subprocess
 
+try:
+    # Optional: the int8 Silero export through onnxruntime skips torch
+    # dispatch entirely and its LSTM runs from a 208KB weight file
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
 # Configure Logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [EAR] %(message)s')
 logger = logging.getLogger("Listener")
 
+# The ear shares the CPU with live mixing apps: inference is pure
+# forward passes, and a single intra-op thread keeps torch from
+# spawning a worker pool that contends with them
+torch.set_grad_enabled(False)
+torch.set_num_threads(1)
+
 # Configuration
 HOST = '0.0.0.0'
 PORT = 9000  # Tailscale Port
@@ -37,18 +50,63 @@ CHUNK_SIZE = 512  # Audio Chunk Size
 RAW_AUDIO_DIR = os.path.expanduser("~/echo/raw")
 os.makedirs(RAW_AUDIO_DIR, exist_ok=True)
 
+# Quantized Silero export (see download_weights.py / setup); used when
+# onnxruntime is installed, otherwise we fall back to torch hub
+VAD_ONNX_PATH = os.path.expanduser("~/echo/brain/silero_vad.int8.onnx")
+
 class NovaSR:
-    """The 52KB Upscaler (Stub/FFmpeg Fallback for V1)"""
-    @staticmethod
-    def upscale_chunk(audio_data: bytes) -> bytes:
-        # In a real implementation: Run inference on the float32 array
-        # For V1 speed: We just assume the stream is acceptable or use simple resampling if needed later.
-        # Adding a placeholder for the 16k -> 48k logic.
-        return audio_data # Pass-through for now to avoid latency delays in python loop
+    """Polyphase 16k -> 48k upsampler.
+
+    A 63-tap windowed-sinc lowpass split into 3 phase filters; each
+    output phase is one short FIR that fits in L1, run as a vectorized
+    np.convolve. Filter history is carried across chunks so utterance
+    audio stays continuous at chunk edges.
+
+    Not wired into handle_client yet: the files in RAW_AUDIO_DIR are
+    consumed as 16 kHz PCM, so turning this on is a pipeline decision,
+    not just a call-site change.
+    """
+    def __init__(self):
+        up = SAMPLE_RATE_OUT // SAMPLE_RATE_IN  # 3
+        taps = 63
+        n = np.arange(taps) - (taps - 1) / 2.0
+        h = np.sinc(n / up) * np.hamming(taps)
+        h *= up / h.sum()  # unity passband gain after zero-stuffing
+        self._up = up
+        self._phases = [np.ascontiguousarray(h[p::up], dtype=np.float32)
+                        for p in range(up)]
+        self._tail = np.zeros(taps // up - 1, dtype=np.float32)
+
+    def upscale_chunk(self, audio_data: bytes) -> bytes:
+        x = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+        xs = np.concatenate((self._tail, x))
+        self._tail = xs[-self._tail.shape[0]:]
+        out = np.empty(x.shape[0] * self._up, dtype=np.float32)
+        for p, hp in enumerate(self._phases):
+            out[p::self._up] = np.convolve(xs, hp, mode='valid')
+        np.clip(out, -32768, 32767, out=out)
+        return out.astype(np.int16).tobytes()
 
 class SileroVAD:
     def __init__(self):
         logger.info("Loading Silero VAD...")
+        self.model = None
+        self.session = None
+        if ort is not None and os.path.exists(VAD_ONNX_PATH):
+            try:
+                so = ort.SessionOptions()
+                so.intra_op_num_threads = 1  # same rationale as torch above
+                self.session = ort.InferenceSession(
+                    VAD_ONNX_PATH, sess_options=so,
+                    providers=["CPUExecutionProvider"])
+                # Streaming LSTM state carried across chunks
+                self._state = np.zeros((2, 1, 128), dtype=np.float32)
+                self._sr = np.array(SAMPLE_RATE_IN, dtype=np.int64)
+                logger.info("Silero VAD Loaded (ONNX int8).")
+                return
+            except Exception as e:
+                logger.error(f"ONNX VAD load failed, falling back to torch: {e}")
+                self.session = None
         try:
             # Load from Torch Hub (Cached)
             self.model, utils = torch.hub.load(repo_or_dir='snakers4/silero-vad',
@@ -57,39 +115,83 @@ class SileroVAD:
                                               trust_repo=True)
             (self.get_speech_timestamps, self.save_audio, self.read_audio, self.VADIterator, self.collect_chunks) = utils
             self.model.eval()
+            try:
+                # int8 weights on the Linear layers halve bandwidth per
+                # frame; qnnpack carries the NEON kernels on Apple CPUs.
+                # Hub may hand back a ScriptModule that dynamic
+                # quantization can't rewrite — then we just stay fp32.
+                if "qnnpack" in torch.backends.quantized.supported_engines:
+                    torch.backends.quantized.engine = "qnnpack"
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8)
+                logger.info("VAD quantized to int8 (dynamic).")
+            except Exception as e:
+                logger.warning(f"Dynamic quantization unavailable, staying fp32: {e}")
             logger.info("Silero VAD Loaded.")
         except Exception as e:
             logger.error(f"Failed to load Silero VAD: {e}")
             self.model = None
 
     def is_speech(self, audio_chunk_float32):
+        if self.session is not None:
+            with _VAD_LOCK:
+                prob, self._state = self.session.run(None, {
+                    "input": audio_chunk_float32.reshape(1, -1),
+                    "state": self._state,
+                    "sr": self._sr,
+                })
+            return float(prob[0][0]) > 0.5
         if self.model is None: return True # Fail open
         # VAD requires tensor input - typical model expects [batch, steps]
         # Silero VAD is finicky with chunk sizes, usually 512 samples at 16k is ok.
-        with torch.no_grad():
+        # The lock serializes the shared model's hidden state across clients
+        with _VAD_LOCK, torch.no_grad():
             speech_prob = self.model(torch.from_numpy(audio_chunk_float32), SAMPLE_RATE_IN).item()
         return speech_prob > 0.5
 
+# One shared model: torch.hub.load costs seconds of wall time and tens
+# of MB, so a per-connection instance was the dominant connect latency
+_VAD = None
+_VAD_LOCK = threading.Lock()
+
+def _get_vad() -> SileroVAD:
+    global _VAD
+    if _VAD is None:
+        with _VAD_LOCK:
+            if _VAD is None:
+                _VAD = SileroVAD()
+    return _VAD
+
 def handle_client(conn, addr):
     logger.info(f"Connected to {addr}")
-    vad = SileroVAD()
-    
+    vad = _get_vad()
+
     # We need a file to write to when speech is detected
     current_file = None
     file_counter = 0
     silence_frames = 0
-    
+
+    # Reused conversion buffer: one fused cast+scale pass into scratch
+    # instead of a fresh astype copy and divide temp every 32 ms
+    scratch = np.empty(CHUNK_SIZE, dtype=np.float32)
+    inv_scale = np.float32(1.0 / 32768.0)
+
+    # Receive into a reused buffer; MSG_WAITALL makes the kernel
+    # assemble the full 512-sample frame, so short reads stop silently
+    # dropping audio. audio_int16 is a standing view over those bytes.
+    recv_buf = bytearray(CHUNK_SIZE * 2)  # 1024 bytes = 512 samples (int16)
+    recv_view = memoryview(recv_buf)
+    audio_int16 = np.frombuffer(recv_buf, dtype=np.int16)
+
     try:
         while True:
-            data = conn.recv(1024) # 1024 bytes = 512 samples (int16)
-            if not data: break
-            
+            n = conn.recv_into(recv_view, len(recv_buf), socket.MSG_WAITALL)
+            if n < len(recv_buf): break  # closed (0) or partial final frame
+
             # 1. Process VAD
-            audio_int16 = np.frombuffer(data, dtype=np.int16)
-            if len(audio_int16) < 256: continue 
-            
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
-            
+            audio_float32 = scratch
+            np.multiply(audio_int16, inv_scale, out=audio_float32)
+
             # Silero expects strictly timed chunks, handling stream robustly is complex.
             # For V1 "Mobile Ear", we might enable basic energy/VAD.
             is_speech_frame = vad.is_speech(audio_float32)
@@ -100,12 +202,14 @@ def handle_client(conn, addr):
                     # Start new utterance
                     timestamp = int(time.time())
                     filename = os.path.join(RAW_AUDIO_DIR, f"mobile_{timestamp}.pcm")
-                    current_file = open(filename, "wb")
+                    # 64KB buffer: one write() syscall per ~2s of audio
+                    # instead of one per 32ms frame
+                    current_file = open(filename, "wb", buffering=1 << 16)
                     logger.info("Speech detected. Recording...")
                 
                 # 2. Upscale (NovaSR Stub)
-                # upscaled = NovaSR.upscale_chunk(data)
-                current_file.write(data)
+                # upscaled = NovaSR.upscale_chunk(recv_buf)
+                current_file.write(recv_buf)  # BufferedWriter copies; reuse is safe
                 
             else:
                 silence_frames += 1
@@ -125,6 +229,7 @@ def start_server():
     server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server.bind((HOST, PORT))
     server.listen(1)
+    _get_vad()  # Load the model before accepting, not on first client
     logger.info(f"Mobile Ear Listening on {HOST}:{PORT}")
     
     while True:
@@ -9,11 +9,11 @@ import asyncio
 import subprocess
 import re
 import ast
-import pytz
 import time
 import json
 from datetime import datetime, timedelta
 from typing import Optional, Dict
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -29,6 +29,9 @@ import wygiwyh_client
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 MLX_URL = "http://127.0.0.1:1234/v1"
 
+# Home timezone, built once at import (zone construction reads tzdata)
+MAURITIUS_TZ = ZoneInfo('Indian/Mauritius')
+
 
 # --- TOOLS DEFINITION ---
 
@@ -331,9 +334,9 @@ ENTITY MAPPING RULES:
 - For multi-person requests, handle EACH entity separately with their correct ID.
 - Never guess or reuse IDs - always verify from memory first.
 
-Current Date & Time: {datetime.now(pytz.timezone('Indian/Mauritius')).strftime("%A, %B %d, %Y at %I:%M %p")} (Mauritius Time)
-Today is: {datetime.now(pytz.timezone('Indian/Mauritius')).strftime("%A")}
-Current Year: {datetime.now(pytz.timezone('Indian/Mauritius')).year}
+Current Date & Time: {datetime.now(MAURITIUS_TZ).strftime("%A, %B %d, %Y at %I:%M %p")} (Mauritius Time)
+Today is: {datetime.now(MAURITIUS_TZ).strftime("%A")}
+Current Year: {datetime.now(MAURITIUS_TZ).year}
 """
     
     # Format messages for the API
@@ -619,8 +622,7 @@ def parse_date(date_str):
         return date_str
     
     date_str_lower = date_str.lower().strip()
-    mauritius_tz = pytz.timezone('Indian/Mauritius')
-    now = datetime.now(mauritius_tz)
+    now = datetime.now(MAURITIUS_TZ)
     
     # Already in YYYY-MM-DD format
     if re.match(r'\d{4}-\d{2}-\d{2}', date_str):
@@ -326,7 +326,7 @@ def test_database_integrity():
             task_count = cursor.fetchone()[0]
             print_result("Task count", task_count >= 0, f"{task_count} tasks")
 
-        conn.close()
+        database.close_connection()
         return has_all_tables
     except Exception as e:
         print_result("Database integrity", False, str(e))
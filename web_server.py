@@ -2269,7 +2269,7 @@ routes = [
     Mount("/static", StaticFiles(directory="static"), name="static"),
 ]
 
-app = Starlette(routes=routes, on_startup=[startup])
+app = Starlette(routes=routes, on_startup=[startup], on_shutdown=[bettershift_proxy.close_proxy_client])
 
 
 if __name__ == "__main__":
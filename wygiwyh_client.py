@@ -7,8 +7,7 @@ import os
 import json
 import httpx
 from typing import List, Dict, Optional
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -209,7 +208,7 @@ class WYGIWYHClient:
             "description": description,
             "category": category["id"],
             "account_id": account["id"],
-            "date": datetime.now(pytz.UTC).strftime("%Y-%m-%d"),
+            "date": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
             "type": tx_type
         }
 